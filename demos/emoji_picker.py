@@ -1,6 +1,6 @@
 import logging
 
-from PySide6.QtGui import QFontDatabase, QShortcut, QKeySequence
+from PySide6.QtGui import QFontDatabase, QShortcut, QKeySequence, QPixmapCache
 import sys
 
 from PySide6.QtCore import Qt, QSize
@@ -27,6 +27,7 @@ from qextrawidgets.gui.icons import QThemeResponsiveIcon
 from qextrawidgets.core.utils.emoji_fonts import QEmojiFonts
 from qextrawidgets.gui.items.icon_item import QIconItem
 from qextrawidgets.widgets.menus.emoji_picker_menu import QEmojiPickerMenu
+from qextrawidgets.widgets.miscellaneous.emoji_picker import QEmojiPicker
 from qextrawidgets.gui.items import QIconCategoryItem
 
 from emoji_data_python import emoji_data
@@ -236,6 +237,8 @@ if __name__ == "__main__":
     # logging.basicConfig(level=logging.DEBUG)
 
     app = QApplication(sys.argv)
+    # Keep every emoji of the grid decoded while scrolling
+    QPixmapCache.setCacheLimit(QEmojiPicker.recommendedPixmapCacheLimit(app.devicePixelRatio()))
     window = MainWindow()
     window.setGeometry(100, 500, 800, 600)
     window.show()
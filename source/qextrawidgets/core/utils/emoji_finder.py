@@ -8,6 +8,12 @@ from qextrawidgets.core.regexes.emoji_regex import QEmojiRegex
 
 class QEmojiFinder:
     """Utility class for finding emojis and aliases in text using QRegularExpression."""
+
+    # QRegularExpression compiles its pattern on first use and keeps it,
+    # so the expressions are shared instead of built again on every call
+    _emoji_regex = QEmojiRegex()
+    _alias_regex = QRegularExpression(R"(:\w+:)")
+
     @classmethod
     def findEmojis(cls, text: str) -> typing.Generator[QRegularExpressionMatch, None, None]:
         """Finds all Unicode emojis in the given text.
@@ -18,8 +24,7 @@ class QEmojiFinder:
         Yields:
             Generator[QRegularExpressionMatch]: Matches for each emoji found.
         """
-        regex = QEmojiRegex()
-        iterator = regex.globalMatch(text)
+        iterator = cls._emoji_regex.globalMatch(text)
         while iterator.hasNext():
             yield iterator.next()
 
@@ -33,8 +38,7 @@ class QEmojiFinder:
         Yields:
             Generator[Tuple[EmojiChar, QRegularExpressionMatch]]: Tuples of EmojiChar data and their matches.
         """
-        regex = QRegularExpression(R"(:\w+:)")
-        iterator = regex.globalMatch(text)
+        iterator = cls._alias_regex.globalMatch(text)
         while iterator.hasNext():
             match = iterator.next()
             first_captured = match.captured(0)
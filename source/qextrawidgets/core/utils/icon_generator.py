@@ -1,3 +1,6 @@
+import typing
+from functools import lru_cache
+
 import qtawesome
 from PySide6.QtCore import Qt, QSize, QRect
 from PySide6.QtGui import (
@@ -10,6 +13,32 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QStyle
 
+# Arbitrary large pixel size used to measure text with good precision
+_BASE_PIXEL_SIZE = 100
+
+
+@lru_cache(maxsize=4096)
+def _base_text_size(text: str, font_description: str) -> typing.Tuple[int, int]:
+    """
+    Measures text at the base pixel size.
+    Cached by (text, font), so fitting the same character at several target sizes measures it once.
+
+    Args:
+        text: Text to be measured.
+        font_description: Font serialized with QFont.toString().
+
+    Returns:
+        The horizontal advance and the line height of the text.
+    """
+    font = QFont()
+    font.fromString(font_description)
+    font.setPixelSize(_BASE_PIXEL_SIZE)
+
+    fm = QFontMetrics(font)
+    # horizontalAdvance: Total width including natural spacing
+    # height: Total line height (Ascent + Descent).
+    return fm.horizontalAdvance(text), fm.height()
+
 
 class QIconGenerator:
     """Class responsible for generating Pixmaps and icons based on text/fonts."""
@@ -30,32 +59,21 @@ class QIconGenerator:
         if not text:
             return 12  # safe fallback size
 
-        # 1. Work with a copy to avoid altering the original font externally
-        temp_font = QFont(font)
-
-        # 2. Use an arbitrary large base size for calculation precision
-        base_pixel_size = 100
-        temp_font.setPixelSize(base_pixel_size)
-
-        fm = QFontMetrics(temp_font)
-
-        # 3. Get dimensions occupied by text at base size
-        # horizontalAdvance: Total width including natural spacing
-        base_width = fm.horizontalAdvance(text)
-        # height: Total line height (Ascent + Descent).
-        base_height = fm.height()
+        # 1. Get dimensions occupied by text at an arbitrary large base size, for calculation precision
+        base_pixel_size = _BASE_PIXEL_SIZE
+        base_width, base_height = _base_text_size(text, font.toString())
 
         if base_width == 0 or base_height == 0:
             return base_pixel_size
 
-        # 4. Calculate scale ratio for each dimension
+        # 2. Calculate scale ratio for each dimension
         width_ratio = target_size.width() / base_width
         height_ratio = target_size.height() / base_height
 
-        # 5. The Limiting Factor is the SMALLEST ratio (to ensure it fits both width and height)
+        # 3. The Limiting Factor is the SMALLEST ratio (to ensure it fits both width and height)
         final_scale_factor = min(width_ratio, height_ratio)
 
-        # 6. Apply factor to base size
+        # 4. Apply factor to base size
         new_pixel_size = int(base_pixel_size * final_scale_factor)
 
         # Returns at least 1 to avoid rendering errors
@@ -1,11 +1,29 @@
-from PySide6.QtCore import QSize, QUrl, QUrlQuery
-from PySide6.QtGui import QPixmap, QPixmapCache, Qt, QImageReader, QPainter
+import logging
+import os
+import re
+import threading
+import typing
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from PySide6.QtCore import QSize, QUrl, QUrlQuery, QStandardPaths
+from PySide6.QtGui import QPixmap, QPixmapCache, Qt, QImageReader, QPainter, QImage
 from emoji_data_python import char_to_unified
 from twemoji_api import get_emoji_path
 
+_DISK_CACHE_FILE_PATTERN = re.compile(r"[0-9A-Fa-f]+(?:-[0-9A-Fa-f]+)*-\d+-\d+-[\d.]+-\w+(?:\.png|-\d+-\d+\.tmp)")
+
 
 class QTwemojiImageProvider:
-    """Utility class for loading, resizing, and caching emoji images."""
+    """Utility class for loading, resizing, and caching emoji images.
+
+    Pixmaps are cached in memory with QPixmapCache. The disk cache, disabled by default, also keeps the
+    resized images as PNG files, so later runs skip decoding (or rasterizing, for SVG) the source image.
+    The disk cache holds one file per emoji, margin, size and device pixel ratio used, so it is bounded
+    by the Twemoji set and the sizes the application shows; clearDiskCache empties it.
+    """
+
+    _disk_cache_directory: typing.Optional[Path] = None
 
     @staticmethod
     def getPixmap(emoji: str, margin: int, size: int, dpr: float = 1.0, source_format: str = "png") -> QPixmap:
@@ -23,61 +41,237 @@ class QTwemojiImageProvider:
         Returns:
             QPixmap: The processed pixmap.
         """
+        # 1. Try to fetch from Cache
+        pixmap = QTwemojiImageProvider.findPixmap(emoji, margin, size, dpr, source_format)
+        if pixmap is not None:
+            return pixmap
+
+        # --- CACHE MISS (Load from disk) ---
+        image = QTwemojiImageProvider.getImage(emoji, margin, size, dpr, source_format)
+        if image.isNull():
+            # Fallback (Returns a transparent pixmap or placeholder in case of error)
+            target_size = int(size * dpr)
+            fallback = QPixmap(target_size, target_size)
+            fallback.fill(Qt.GlobalColor.transparent)
+            fallback.setDevicePixelRatio(dpr)
+            return fallback
+
+        # Save to cache for future
+        return QTwemojiImageProvider.insertPixmap(emoji, margin, size, dpr, image, source_format)
+
+    @classmethod
+    def setDiskCacheEnabled(cls, enabled: bool, directory: typing.Union[str, Path, None] = None) -> None:
+        """Enables or disables the disk cache of resized emoji images.
+
+        The default directory is named after the installed twemoji-api version, so images of another
+        Twemoji release are never read back. Directories of other versions are left untouched, since
+        another installed application may still use them.
+
+        Args:
+            enabled (bool): Whether getImage should read and write the disk cache.
+            directory (Union[str, Path], optional): Cache directory. Defaults to a "twemoji/<version>" folder
+                in the application cache location.
+        """
+        if not enabled:
+            cls._disk_cache_directory = None
+            return
+
+        if directory is None:
+            cache_location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+            try:
+                twemoji_version = version("twemoji-api")
+            except PackageNotFoundError:
+                twemoji_version = "unknown"
+            directory = Path(cache_location) / "twemoji" / twemoji_version
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        cls._disk_cache_directory = directory
+
+    @classmethod
+    def clearDiskCache(cls) -> None:
+        """Removes the images stored in the disk cache directory, if enabled.
+
+        Only the files written by this provider are removed; other files in the directory and the
+        directories of other Twemoji versions are kept.
+        """
+        if cls._disk_cache_directory is None:
+            return
+
+        for cache_path in cls._disk_cache_directory.iterdir():
+            if not _DISK_CACHE_FILE_PATTERN.fullmatch(cache_path.name):
+                continue
+            try:
+                cache_path.unlink()
+            except OSError:
+                logging.getLogger(__name__).debug("Could not remove %s", cache_path, exc_info=True)
+
+    @classmethod
+    def isDiskCacheEnabled(cls) -> bool:
+        """Returns whether the disk cache of resized emoji images is enabled.
+
+        Returns:
+            bool: True if the disk cache is enabled.
+        """
+        return cls._disk_cache_directory is not None
+
+    @classmethod
+    def diskCacheDirectory(cls) -> typing.Optional[Path]:
+        """Returns the directory of the disk cache.
+
+        Returns:
+            Optional[Path]: The cache directory, or None if the disk cache is disabled.
+        """
+        return cls._disk_cache_directory
+
+    @classmethod
+    def getImage(cls, emoji: str, margin: int, size: int, dpr: float = 1.0, source_format: str = "png") -> QImage:
+        """Loads an emoji image, from the disk cache when enabled or else from the Twemoji files.
+
+        Only uses QImage and plain file operations, so it is safe to call from worker threads.
+
+        Args:
+            emoji (str): Emoji character.
+            margin (int): Margin around the emoji in pixels.
+            size (int): Target logical size.
+            dpr (float, optional): Device pixel ratio. Defaults to 1.0.
+            source_format (str, optional): Image format (png or svg). Defaults to "png".
+
+        Returns:
+            QImage: The processed image, or a null image if the emoji could not be read.
+        """
+        cache_path = None
+        if cls._disk_cache_directory is not None:
+            cache_path = cls._disk_cache_directory / f"{char_to_unified(emoji)}-{margin}-{size}-{dpr}-{source_format}.png"
+            image = QImage(str(cache_path))
+            if not image.isNull():
+                image.setDevicePixelRatio(dpr)
+                return image
+
+        image = cls._read_image(emoji, margin, size, dpr, source_format)
+
+        if cache_path is not None and not image.isNull():
+            cls._write_disk_cache(image, cache_path)
+
+        return image
+
+    @staticmethod
+    def _write_disk_cache(image: QImage, cache_path: Path) -> None:
+        """Stores an image in the disk cache.
+
+        The disk cache is best effort: a failed write is logged, leaves no file behind and never
+        raises, since it runs inside worker threads.
+
+        Args:
+            image (QImage): The image to store.
+            cache_path (Path): The cache file.
+        """
+        # Write to a temporary file first, so other threads never read a partial image
+        temporary_path = cache_path.with_name(f"{cache_path.stem}-{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            if not image.save(str(temporary_path), "PNG"):
+                raise OSError(f"Could not save {temporary_path}")
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            logging.getLogger(__name__).debug("Could not write the disk cache file %s", cache_path, exc_info=True)
+            try:
+                temporary_path.unlink()
+            except OSError:
+                pass
 
+    @staticmethod
+    def _read_image(emoji: str, margin: int, size: int, dpr: float, source_format: str) -> QImage:
+        """Reads and resizes an emoji image from the Twemoji files.
+
+        Args:
+            emoji (str): Emoji character.
+            margin (int): Margin around the emoji in pixels.
+            size (int): Target logical size.
+            dpr (float): Device pixel ratio.
+            source_format (str): Image format (png or svg).
+
+        Returns:
+            QImage: The processed image, or a null image if the emoji could not be read.
+        """
         # 1. Calculate real physical size (pixels)
         target_size = int(size * dpr)
 
-        # 2. Generate unique key for Cache
+        emoji_path = get_emoji_path(emoji, source_format)
+        if not emoji_path:
+            return QImage()
+
+        # 2. Load using QImageReader (more efficient than QPixmap(path))
+        reader = QImageReader(str(emoji_path))
+        if not reader.canRead():
+            return QImage()
+
+        # Important for SVG: Define render size before reading
+        reader.setScaledSize(QSize(target_size, target_size))
+
+        image = reader.read()
+        if image.isNull():
+            return image
+
+        image.setDevicePixelRatio(dpr)
+
+        # 3. Apply margin
+        if margin > 0:
+            final_size = int((size + (margin * 2)) * dpr)
+            final_image = QImage(final_size, final_size, QImage.Format.Format_ARGB32_Premultiplied)
+            final_image.setDevicePixelRatio(dpr)
+            final_image.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(final_image)
+            painter.drawImage(margin, margin, image)
+            painter.end()
+            image = final_image
+
+        return image
+
+    @staticmethod
+    def findPixmap(emoji: str, margin: int, size: int, dpr: float = 1.0, source_format: str = "png") -> typing.Optional[QPixmap]:
+        """Returns the cached pixmap of an emoji, if any.
+
+        Args:
+            emoji (str): Emoji character.
+            margin (int): Margin around the emoji in pixels.
+            size (int): Target logical size.
+            dpr (float, optional): Device pixel ratio. Defaults to 1.0.
+            source_format (str, optional): Image format (png or svg). Defaults to "png".
+
+        Returns:
+            Optional[QPixmap]: The cached pixmap, or None on a cache miss.
+        """
         cache_url = QTwemojiImageProvider.getUrl(char_to_unified(emoji), margin, size, dpr, source_format)
 
-        # 3. Try to fetch from Cache
         pixmap = QPixmap()
         if QPixmapCache.find(cache_url.toString(), pixmap):
             return pixmap
+        return None
 
-        # --- CACHE MISS (Load from disk) ---
+    @staticmethod
+    def insertPixmap(emoji: str, margin: int, size: int, dpr: float, image: QImage, source_format: str = "png") -> QPixmap:
+        """Converts an image loaded by getImage to a pixmap and caches it.
 
-        # 4. Load using QImageReader (more efficient than QPixmap(path))
-        emoji_path = str(get_emoji_path(emoji, source_format))
-        if not emoji_path:
-            # Fallback (Returns a transparent pixmap or placeholder in case of error)
-            fallback = QPixmap(target_size, target_size)
-            fallback.fill(Qt.GlobalColor.transparent)
-            fallback.setDevicePixelRatio(dpr)
-            return fallback
+        Must be called from the GUI thread.
 
-        reader = QImageReader(emoji_path)
+        Args:
+            emoji (str): Emoji character.
+            margin (int): Margin around the emoji in pixels.
+            size (int): Target logical size.
+            dpr (float): Device pixel ratio.
+            image (QImage): The image returned by getImage.
+            source_format (str, optional): Image format (png or svg). Defaults to "png".
 
-        if reader.canRead():
-            # Important for SVG: Define render size before reading
-            reader.setScaledSize(QSize(target_size, target_size))
+        Returns:
+            QPixmap: The cached pixmap.
+        """
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
 
-            image = reader.read()
-            if not image.isNull():
-                pixmap = QPixmap.fromImage(image)
-                pixmap.setDevicePixelRatio(dpr)
-
-                # Apply margin
-                if margin > 0:
-                    final_size = int((size + (margin * 2)) * dpr)
-                    final_pixmap = QPixmap(final_size, final_size)
-                    final_pixmap.setDevicePixelRatio(dpr)
-                    final_pixmap.fill(Qt.GlobalColor.transparent)
-
-                    painter = QPainter(final_pixmap)
-                    painter.drawPixmap(margin, margin, pixmap)
-                    painter.end()
-                    pixmap = final_pixmap
-
-                # Save to cache for future
-                QPixmapCache.insert(cache_url.toString(), pixmap)
-                return pixmap
-
-        # 5. Fallback (Returns a transparent pixmap or placeholder in case of error)
-        fallback = QPixmap(target_size, target_size)
-        fallback.fill(Qt.GlobalColor.transparent)
-        fallback.setDevicePixelRatio(dpr)
-        return fallback
+        cache_url = QTwemojiImageProvider.getUrl(char_to_unified(emoji), margin, size, dpr, source_format)
+        QPixmapCache.insert(cache_url.toString(), pixmap)
+        return pixmap
 
     @staticmethod
     def getUrl(alias: str, margin: int, size: int, dpr: float, source_format: str) -> QUrl:
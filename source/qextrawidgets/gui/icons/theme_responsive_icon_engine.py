@@ -11,6 +11,12 @@ class QThemeResponsiveIconEngine(QIconEngine):
     the icon fits within the requested dimensions without clipping.
     """
 
+    # Color applied to the icon mask for each supported color scheme
+    _SchemeColors: typing.Dict[Qt.ColorScheme, QColor] = {
+        Qt.ColorScheme.Light: QColor(Qt.GlobalColor.black),
+        Qt.ColorScheme.Dark: QColor(Qt.GlobalColor.white),
+    }
+
     def __init__(self, icon: QIcon) -> None:
         """Initializes the icon engine.
 
@@ -19,10 +25,8 @@ class QThemeResponsiveIconEngine(QIconEngine):
         """
         super().__init__()
         self._source_icon = icon
-        self._theme_icons: typing.Dict[Qt.ColorScheme, QIcon] = {
-            Qt.ColorScheme.Light: self._generate_colored_icon(icon, QColor(Qt.GlobalColor.black)),
-            Qt.ColorScheme.Dark: self._generate_colored_icon(icon, QColor(Qt.GlobalColor.white)),
-        }
+        # The colored icons are generated on first use, since most icons are only ever painted in one scheme
+        self._theme_icons: typing.Dict[Qt.ColorScheme, QIcon] = {}
 
     def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State) -> None:
         """Paints the icon.
@@ -60,10 +64,9 @@ class QThemeResponsiveIconEngine(QIconEngine):
             pixmap = QPixmap.fromImage(pixmap)
 
         self._source_icon.addPixmap(pixmap, mode, state)
-        dark_icon = self._theme_icons[Qt.ColorScheme.Dark]
-        dark_icon.addPixmap(self._generate_colored_pixmap(pixmap, QColor(Qt.GlobalColor.white)), mode, state)
-        light_icon = self._theme_icons[Qt.ColorScheme.Light]
-        light_icon.addPixmap(self._generate_colored_pixmap(pixmap, QColor(Qt.GlobalColor.black)), mode, state)
+        # Icons not generated yet pick the pixmap up from the source icon when they are
+        for scheme, theme_icon in self._theme_icons.items():
+            theme_icon.addPixmap(self._generate_colored_pixmap(pixmap, self._SchemeColors[scheme]), mode, state)
 
     def addFile(self, file_name: str, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> None:
         """Adds a file to the source icon.
@@ -140,10 +143,14 @@ class QThemeResponsiveIconEngine(QIconEngine):
         Raises:
             ValueError: If the scheme is unsupported.
         """
-        if self._theme_icons.get(scheme) is None:
-            raise ValueError(f"Unsupported color scheme: {scheme}")
-        else:
-            return self._theme_icons[scheme]
+        theme_icon = self._theme_icons.get(scheme)
+        if theme_icon is None:
+            color = self._SchemeColors.get(scheme)
+            if color is None:
+                raise ValueError(f"Unsupported color scheme: {scheme}")
+            theme_icon = self._generate_colored_icon(self._source_icon, color)
+            self._theme_icons[scheme] = theme_icon
+        return theme_icon
 
     def currentThemeIcon(self) -> QIcon:
         """Returns the icon for the current application theme.
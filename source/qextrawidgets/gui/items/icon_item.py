@@ -16,15 +16,42 @@ class QIconItem(QStandardItem):
         """
         SupportColorModifier = Qt.ItemDataRole.UserRole + 1
         ColorModifierRole = Qt.ItemDataRole.UserRole + 2
+        SearchTextRole = Qt.ItemDataRole.UserRole + 3
+
+    # Separates the aliases in SearchTextRole, so a search match never spans two of them
+    SearchTextSeparator = "\0"
 
     def __init__(self, text: str, support_color_modifier: bool, aliases: typing.Optional[typing.List[str]] = None, color_modifier: typing.Optional[str] = None):
-        super().__init__()
-        self.setData(text, Qt.ItemDataRole.EditRole)
-        self.setData(support_color_modifier, QIconItem.QIconItemDataRole.SupportColorModifier)
+        # The text goes through the constructor and the other roles through QStandardItem.setData directly,
+        # since models with thousands of icons are built at startup and every Python dispatch counts
+        super().__init__(text)
+        # Most icons do not support a color modifier, and a missing role reads as None, so False is not stored
+        if support_color_modifier:
+            QStandardItem.setData(self, True, QIconItem.QIconItemDataRole.SupportColorModifier)
         if aliases:
-            self.setData(aliases, Qt.ItemDataRole.UserRole)
+            QStandardItem.setData(self, aliases, Qt.ItemDataRole.UserRole)
+            QStandardItem.setData(self, self.SearchTextSeparator.join(aliases), QIconItem.QIconItemDataRole.SearchTextRole)
+        else:
+            QStandardItem.setData(self, text, QIconItem.QIconItemDataRole.SearchTextRole)
         if color_modifier:
-            self.setData(color_modifier, QIconItem.QIconItemDataRole.ColorModifierRole)
+            QStandardItem.setData(self, color_modifier, QIconItem.QIconItemDataRole.ColorModifierRole)
+
+    def setData(self, value: typing.Any, role: int = Qt.ItemDataRole.UserRole + 1) -> None:
+        """
+        Sets the data for the given role.
+        Setting the aliases (UserRole) also stores their search text in SearchTextRole,
+        as does setting the text of an icon without aliases.
+
+        Args:
+            value: The data value.
+            role: The data role.
+        """
+        super().setData(value, role)
+        if role == Qt.ItemDataRole.UserRole:
+            search_text = self.SearchTextSeparator.join(value) if value else self.text()
+            super().setData(search_text, QIconItem.QIconItemDataRole.SearchTextRole)
+        elif role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) and not self.data(Qt.ItemDataRole.UserRole):
+            super().setData(self.text(), QIconItem.QIconItemDataRole.SearchTextRole)
 
     def parent(self) -> typing.Optional[QIconCategoryItem]:  # type: ignore[override]
         """
@@ -46,10 +73,11 @@ class QIconItem(QStandardItem):
             QIconItem: A copy of this QIconItem.
         """
         return QIconItem(self.data(Qt.ItemDataRole.EditRole),
-                         self.data(QIconItem.QIconItemDataRole.SupportColorModifier),
+                         bool(self.data(QIconItem.QIconItemDataRole.SupportColorModifier)),
                          self.data(Qt.ItemDataRole.UserRole),
                          self.data(QIconItem.QIconItemDataRole.ColorModifierRole))
 
     @staticmethod
     def fromEmojiChar(emoji_char: EmojiChar):
         return QIconItem(emoji_char.char, bool(emoji_char.skin_variations), emoji_char.short_names)
+
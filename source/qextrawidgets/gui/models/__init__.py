@@ -1,5 +1,7 @@
+from .filtered_unique_checked_list_model import QFilteredUniqueCheckedListModel
 from .icon_picker_model import QIconPickerModel
 
 __all__ = [
+    "QFilteredUniqueCheckedListModel",
     "QIconPickerModel",
 ]
@@ -0,0 +1,305 @@
+import typing
+from enum import Enum
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    Slot,
+)
+
+
+class QFilteredUniqueCheckedListModel(QAbstractListModel):
+    """A list model with the unique values of a source column, each with a check state.
+
+    Fuses what QUniqueValuesProxyModel, QCheckStateProxyModel and a QSortFilterProxyModel do
+    as a chain into a single model. The state is kept as parallel arrays indexed by value
+    (values, lowercase values, first source row, check flags) plus the list of visible value
+    indexes in display order, so each access is one lookup instead of three proxy hops.
+
+    Check states are kept by value, so they survive source model changes.
+    """
+
+    class QFilteredUniqueCheckedListRole(int, Enum):
+        """
+        Custom data roles for the model.
+        """
+        MultipleRolesRole = Qt.ItemDataRole.UserRole + 256
+
+    # Roles bundled by MultipleRolesRole, matching what QStyledItemDelegate.initStyleOption reads
+    MultipleRoles: typing.Tuple[Qt.ItemDataRole, ...] = (
+        Qt.ItemDataRole.FontRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.CheckStateRole,
+        Qt.ItemDataRole.DecorationRole,
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.BackgroundRole,
+    )
+
+    def __init__(self, parent: typing.Optional[QObject] = None) -> None:
+        """Initializes the model.
+
+        Args:
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._source_model: typing.Optional[QAbstractItemModel] = None
+        self._target_column = 0
+        self._default_check_state = Qt.CheckState.Checked
+        self._filter_text = ""
+        self._sort_order: typing.Optional[Qt.SortOrder] = None
+
+        # Parallel arrays, one entry per unique value
+        self._values: typing.List[str] = []
+        self._lower_values: typing.List[str] = []
+        self._display_values: typing.List[typing.Any] = []
+        self._source_rows: typing.List[int] = []
+        self._checked = bytearray()
+
+        # Value indexes shown by the model, filtered and sorted
+        self._visible: typing.List[int] = []
+
+    # --- Source Model ---
+
+    def setSourceModel(self, source_model: typing.Optional[QAbstractItemModel]) -> None:
+        """Sets the model whose column provides the unique values.
+
+        Args:
+            source_model (QAbstractItemModel, optional): The source model.
+        """
+        if self._source_model is not None:
+            self._source_model.modelReset.disconnect(self._rebuild)
+            self._source_model.layoutChanged.disconnect(self._rebuild)
+            self._source_model.rowsInserted.disconnect(self._rebuild)
+            self._source_model.rowsRemoved.disconnect(self._rebuild)
+            self._source_model.dataChanged.disconnect(self._rebuild)
+
+        self._source_model = source_model
+
+        if source_model is not None:
+            source_model.modelReset.connect(self._rebuild)
+            source_model.layoutChanged.connect(self._rebuild)
+            source_model.rowsInserted.connect(self._rebuild)
+            source_model.rowsRemoved.connect(self._rebuild)
+            source_model.dataChanged.connect(self._rebuild)
+
+        self._rebuild()
+
+    def sourceModel(self) -> typing.Optional[QAbstractItemModel]:
+        """Returns the source model."""
+        return self._source_model
+
+    def setTargetColumn(self, column: int) -> None:
+        """Sets the source column to collect unique values from.
+
+        Args:
+            column (int): Source column.
+        """
+        if self._target_column != column:
+            self._target_column = column
+            self._rebuild()
+
+    def targetColumn(self) -> int:
+        """Returns the source column unique values are collected from."""
+        return self._target_column
+
+    @Slot()
+    def _rebuild(self) -> None:
+        """Collects the unique values of the source column, keeping known check states."""
+        previous_checks = dict(zip(self._values, self._checked))
+        default_checked = self._default_check_state == Qt.CheckState.Checked
+
+        self.beginResetModel()
+
+        self._values = []
+        self._lower_values = []
+        self._display_values = []
+        self._source_rows = []
+
+        source = self._source_model
+        if source is not None:
+            seen_values = set()
+            for row in range(source.rowCount()):
+                display_value = source.index(row, self._target_column).data(Qt.ItemDataRole.DisplayRole)
+                value = str(display_value)
+
+                if value not in seen_values:
+                    seen_values.add(value)
+                    self._values.append(value)
+                    self._lower_values.append(value.lower())
+                    self._display_values.append(display_value)
+                    self._source_rows.append(row)
+
+        self._checked = bytearray(previous_checks.get(value, default_checked) for value in self._values)
+        self._visible = self._compute_visible()
+
+        self.endResetModel()
+
+    def _compute_visible(self) -> typing.List[int]:
+        """Returns the value indexes accepted by the filter text, in sort order."""
+        if self._filter_text:
+            needle = self._filter_text
+            visible = [position for position, value in enumerate(self._lower_values) if needle in value]
+        else:
+            visible = list(range(len(self._values)))
+
+        if self._sort_order is not None:
+            visible.sort(
+                key=self._sort_key,
+                reverse=self._sort_order == Qt.SortOrder.DescendingOrder,
+            )
+
+        return visible
+
+    def _sort_key(self, position: int) -> typing.Tuple[int, typing.Any]:
+        """Sort key for a value index: numbers first in numeric order, then text case-insensitively."""
+        display_value = self._display_values[position]
+        if isinstance(display_value, (int, float)) and not isinstance(display_value, bool):
+            return 0, display_value
+        return 1, self._lower_values[position]
+
+    # --- Filtering and Sorting ---
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        """Shows only the values containing the pattern, case-insensitively.
+
+        Args:
+            pattern (str): The text to search for.
+        """
+        filter_text = pattern.lower() if pattern else ""
+        if filter_text == self._filter_text:
+            return
+
+        self._filter_text = filter_text
+        self.beginResetModel()
+        self._visible = self._compute_visible()
+        self.endResetModel()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sorts the visible values.
+
+        Args:
+            column (int): Ignored, the model has a single column.
+            order (Qt.SortOrder): The sort order.
+        """
+        self.layoutAboutToBeChanged.emit()
+        self._sort_order = order
+        self._visible = self._compute_visible()
+        self.layoutChanged.emit()
+
+    # --- Check States ---
+
+    def setInitialCheckState(self, state: Qt.CheckState) -> None:
+        """Sets the check state given to values seen for the first time.
+
+        Args:
+            state (Qt.CheckState): The default check state.
+        """
+        self._default_check_state = state
+
+    def setVisibleCheckState(self, state: Qt.CheckState) -> None:
+        """Sets the check state of every value accepted by the current filter.
+
+        Emits a single dataChanged for the whole range.
+
+        Args:
+            state (Qt.CheckState): The check state.
+        """
+        checked = state == Qt.CheckState.Checked
+        for position in self._visible:
+            self._checked[position] = checked
+        self._emit_check_state_changed()
+
+    def visibleCheckedCount(self) -> int:
+        """Returns how many values accepted by the current filter are checked."""
+        checked = self._checked
+        return sum(checked[position] for position in self._visible)
+
+    def visibleCheckedValues(self) -> typing.Set[str]:
+        """Returns the checked values accepted by the current filter."""
+        checked = self._checked
+        values = self._values
+        return {values[position] for position in self._visible if checked[position]}
+
+    def uniqueCount(self) -> int:
+        """Returns the number of unique values, ignoring the filter."""
+        return len(self._values)
+
+    def _emit_check_state_changed(self) -> None:
+        """Notifies the views that the check state of every row changed."""
+        if self._visible:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._visible) - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+    # --- QAbstractListModel Implementation ---
+
+    def rowCount(self, parent: typing.Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> int:
+        """Returns the number of visible values."""
+        if parent.isValid():
+            return 0
+        return len(self._visible)
+
+    def flags(self, index: typing.Union[QModelIndex, QPersistentModelIndex]) -> Qt.ItemFlag:
+        """Returns the item flags for the given index, ensuring it is checkable."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(
+        self,
+        index: typing.Union[QModelIndex, QPersistentModelIndex],
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> typing.Any:
+        """Returns the data for the given index and role.
+
+        Roles other than display and check state are read from the first source row holding the value.
+        """
+        if not index.isValid():
+            return None
+
+        position = self._visible[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_values[position]
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._checked[position] else Qt.CheckState.Unchecked
+
+        if role == QFilteredUniqueCheckedListModel.QFilteredUniqueCheckedListRole.MultipleRolesRole:
+            source_index = self._source_index(position)
+            values = {multiple_role: source_index.data(multiple_role) for multiple_role in self.MultipleRoles}
+            values[Qt.ItemDataRole.DisplayRole] = self._display_values[position]
+            values[Qt.ItemDataRole.CheckStateRole] = (
+                Qt.CheckState.Checked if self._checked[position] else Qt.CheckState.Unchecked
+            )
+            return values
+
+        return self._source_index(position).data(role)
+
+    def setData(
+        self,
+        index: typing.Union[QModelIndex, QPersistentModelIndex],
+        value: typing.Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Sets the check state for the given index."""
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid():
+            return False
+
+        self._checked[self._visible[index.row()]] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def _source_index(self, position: int) -> QModelIndex:
+        """Returns the source index of the first row holding the value at position."""
+        if self._source_model is None:
+            return QModelIndex()
+        return self._source_model.index(self._source_rows[position], self._target_column)
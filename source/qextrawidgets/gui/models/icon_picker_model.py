@@ -1,18 +1,56 @@
 import logging
 import time
 import typing
+from contextlib import contextmanager
 from enum import Enum, auto
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 
 import qtawesome
 from PySide6.QtCore import Qt, QT_TRANSLATE_NOOP, QModelIndex, Slot, Signal
 from PySide6.QtGui import QIcon, QPixmap, QStandardItemModel
-from emoji_data_python import emoji_data
+from emoji_data_python import EmojiChar, emoji_data
 
 from qextrawidgets.gui.icons import QThemeResponsiveIcon
 from qextrawidgets.gui.items import QIconCategoryItem
 from qextrawidgets.gui.items.icon_item import QIconItem
 
 
+@lru_cache(maxsize=None)
+def _emoji_data_by_category() -> typing.Mapping[str, typing.Tuple[EmojiChar, ...]]:
+    """
+    Returns the emojis of each category in display order, without the skin tone components.
+    Cached so every model populated with emojis shares one sort and grouping of the database.
+    """
+    emoji_chars_by_category: typing.Dict[str, typing.List[EmojiChar]] = {}
+    for emoji_char in sorted(emoji_data, key=attrgetter("sort_order")):
+        category = emoji_char.category
+        if category != "Component":
+            emoji_chars = emoji_chars_by_category.get(category)
+            if emoji_chars is None:
+                emoji_chars = emoji_chars_by_category[category] = []
+            emoji_chars.append(emoji_char)
+
+    return MappingProxyType({category: tuple(emoji_chars) for category, emoji_chars in emoji_chars_by_category.items()})
+
+
+@lru_cache(maxsize=None)
+def _category_icon(icon_name: str, scale_factor: float = 1.0) -> QThemeResponsiveIcon:
+    """
+    Returns the theme responsive icon of a category from its qtawesome icon name.
+    Cached so every model shares one icon per category instead of building it for each instance.
+
+    Args:
+        icon_name: QtAwesome icon name.
+        scale_factor: Scale factor of the glyph in the icon.
+
+    Returns:
+        The category icon.
+    """
+    return QThemeResponsiveIcon.fromAwesome(icon_name, options=[{"scale_factor": scale_factor}])
+
+
 class QIconPickerModel(QStandardItemModel):
     """
     Model for managing icons categories and items using QStandardItemModel.
@@ -48,17 +86,70 @@ class QIconPickerModel(QStandardItemModel):
         Emojis = auto()
         AwesomeIcons = auto()
 
+    # Icon of each emoji category
+    _EMOJI_CATEGORY_ICONS: typing.Mapping[str, str] = MappingProxyType({
+        EmojiCategory.SmileysAndEmotion: "fa6s.face-smile",
+        EmojiCategory.PeopleAndBody: "fa6s.user",
+        EmojiCategory.AnimalsAndNature: "fa6s.leaf",
+        EmojiCategory.FoodAndDrink: "fa6s.bowl-food",
+        EmojiCategory.Symbols: "fa6s.heart",
+        EmojiCategory.Activities: "fa6s.gamepad",
+        EmojiCategory.Objects: "fa6s.lightbulb",
+        EmojiCategory.TravelAndPlaces: "fa6s.bicycle",
+        EmojiCategory.Flags: "fa6s.flag",
+    })
+
+    # Display order of the emoji categories, following a typical picker order
+    _EMOJI_CATEGORIES_ORDER: typing.Tuple[str, ...] = (
+        EmojiCategory.SmileysAndEmotion,
+        EmojiCategory.PeopleAndBody,
+        EmojiCategory.AnimalsAndNature,
+        EmojiCategory.FoodAndDrink,
+        EmojiCategory.Activities,
+        EmojiCategory.TravelAndPlaces,
+        EmojiCategory.Objects,
+        EmojiCategory.Symbols,
+        EmojiCategory.Flags,
+    )
+
+    # Icon of each qtawesome font collection
+    _AWESOME_CATEGORY_ICONS: typing.Mapping[str, str] = MappingProxyType({
+        "fa5": "fa5.font-awesome-logo-full",
+        "fa5s": "fa5s.font-awesome-logo-full",
+        "fa5b": "fa5b.font-awesome-flag",
+        "fa6": "fa6.font-awesome",
+        "fa6s": "fa6s.font-awesome",
+        "fa6b": "fa6b.font-awesome",
+        "mdi": "mdi.material-design",
+        "mdi6": "mdi6.material-design",
+        "ei": "ei.redux",
+        "ph": "ph.phosphor-logo",
+        "ri": "ri.remixicon-fill",
+        "msc": "mdi.microsoft-visual-studio"
+    })
+
     categoryInserted = Signal(QIconCategoryItem)
     categoryRemoved = Signal(QIconCategoryItem)
     iconInserted = Signal(QIconCategoryItem, QIconItem)
     iconRemoved = Signal(QIconCategoryItem, QIconItem)
     colorChanged = Signal(QModelIndex)
 
-    def __init__(self, populate_method: typing.Optional[QIconPickerModel.PopulateSource] = None):
+    def __init__(self, populate_method: typing.Optional["QIconPickerModel.PopulateSource"] = None):
         """
         Initialize the QIconPickerModel.
         """
         super().__init__()
+
+        # Lookup tables kept in sync with the items: category name -> category item,
+        # and category name -> icon text -> icon item
+        self._category_items: typing.Dict[str, QIconCategoryItem] = {}
+        self._icon_items: typing.Dict[str, typing.Dict[str, QIconItem]] = {}
+        # Subset of _icon_items supporting a color modifier, the only icons setColorModifier changes
+        self._color_modifier_items: typing.Dict[str, typing.Dict[str, QIconItem]] = {}
+        self._batch_depth = 0
+        # Icons queued by addIcon inside deferIconInsertions: category name -> icon text -> icon item
+        self._deferred_icons: typing.Optional[typing.Dict[str, typing.Dict[str, QIconItem]]] = None
+
         if populate_method:
             self.populate(populate_method)
         self.setup_connections()
@@ -66,6 +157,117 @@ class QIconPickerModel(QStandardItemModel):
     def setup_connections(self):
         self.rowsInserted.connect(self._on_rows_inserted)
         self.rowsAboutToBeRemoved.connect(self._on_rows_removed)
+        self.dataChanged.connect(self._on_data_changed)
+        self.modelReset.connect(self._rebuild_lookup)
+
+    def _index_category(self, category_item: QIconCategoryItem) -> None:
+        """
+        Adds a category and its icons to the lookup tables.
+
+        Args:
+            category_item (QIconCategoryItem): The category item.
+        """
+        category_name = category_item.category()
+        self._category_items[category_name] = category_item
+        icon_items = self._icon_items.setdefault(category_name, {})
+        color_modifier_items = self._color_modifier_items.setdefault(category_name, {})
+
+        for row in range(category_item.rowCount()):
+            child_item = category_item.child(row)
+            if isinstance(child_item, QIconItem):
+                icon_text = child_item.data(Qt.ItemDataRole.EditRole)
+                if (icon_items.setdefault(icon_text, child_item) is child_item
+                        and child_item.data(QIconItem.QIconItemDataRole.SupportColorModifier)):
+                    color_modifier_items[icon_text] = child_item
+
+    def _unindex_category(self, category_item: QIconCategoryItem) -> None:
+        """
+        Removes a category and its icons from the lookup tables.
+
+        Args:
+            category_item (QIconCategoryItem): The category item.
+        """
+        category_name = category_item.category()
+        if self._category_items.get(category_name) is category_item:
+            del self._category_items[category_name]
+            self._icon_items.pop(category_name, None)
+            self._color_modifier_items.pop(category_name, None)
+
+    def _index_icon(self, category_item: QIconCategoryItem, icon_item: QIconItem) -> None:
+        """
+        Adds an icon to the lookup tables.
+
+        Args:
+            category_item (QIconCategoryItem): The category holding the icon.
+            icon_item (QIconItem): The icon item.
+        """
+        category_name = category_item.category()
+        icon_text = icon_item.data(Qt.ItemDataRole.EditRole)
+        icon_items = self._icon_items.setdefault(category_name, {})
+        if (icon_items.setdefault(icon_text, icon_item) is icon_item
+                and icon_item.data(QIconItem.QIconItemDataRole.SupportColorModifier)):
+            self._color_modifier_items.setdefault(category_name, {})[icon_text] = icon_item
+
+    def _unindex_icon(self, category_item: QIconCategoryItem, icon_item: QIconItem) -> None:
+        """
+        Removes an icon from the lookup tables.
+
+        Args:
+            category_item (QIconCategoryItem): The category holding the icon.
+            icon_item (QIconItem): The icon item.
+        """
+        icon_items = self._icon_items.get(category_item.category())
+        if icon_items is None:
+            return
+
+        icon_text = icon_item.data(Qt.ItemDataRole.EditRole)
+        if icon_items.get(icon_text) is icon_item:
+            del icon_items[icon_text]
+            self._color_modifier_items.get(category_item.category(), {}).pop(icon_text, None)
+
+    @Slot()
+    def _rebuild_lookup(self) -> None:
+        """Rebuilds the lookup tables from the items in the model."""
+        self._category_items.clear()
+        self._icon_items.clear()
+        self._color_modifier_items.clear()
+
+        for row in range(self.rowCount()):
+            item = self.item(row)
+            if isinstance(item, QIconCategoryItem):
+                self._category_items.setdefault(item.category(), item)
+
+        for category_item in self._category_items.values():
+            self._index_category(category_item)
+
+    @Slot(QModelIndex, QModelIndex, list)
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: typing.Optional[typing.List[int]] = None) -> None:
+        """
+        Updates the lookup tables when a category name or an icon text changes.
+
+        Icon text and color modifier support changes only re-index the icons of their own category; aliases (UserRole) are not
+        lookup keys.
+
+        Args:
+            top_left (QModelIndex): Top left changed index.
+            bottom_right (QModelIndex): Bottom right changed index.
+            roles (List[int], optional): Changed roles.
+        """
+        parent = top_left.parent()
+
+        if not parent.isValid():
+            if not roles or Qt.ItemDataRole.UserRole in roles:
+                self._rebuild_lookup()
+            return
+
+        if roles and Qt.ItemDataRole.EditRole not in roles and QIconItem.QIconItemDataRole.SupportColorModifier not in roles:
+            return
+
+        category_item = self.itemFromIndex(parent)
+        if isinstance(category_item, QIconCategoryItem) and self._category_items.get(category_item.category()) is category_item:
+            self._icon_items[category_item.category()] = {}
+            self._color_modifier_items[category_item.category()] = {}
+            self._index_category(category_item)
 
     @Slot(QModelIndex, int, int)
     def _on_rows_removed(self, parent: QModelIndex, first: int, last: int):
@@ -89,12 +291,14 @@ class QIconPickerModel(QStandardItemModel):
                     child_index = self.index(row, 0, parent)
                     child_item = self.itemFromIndex(child_index)
                     if isinstance(child_item, QIconItem):
+                        self._unindex_icon(parent_item, child_item)
                         self.iconRemoved.emit(parent_item, child_item)
             return
 
         for row in range(first, last + 1):
             item = self.itemFromIndex(self.index(row, 0))
             if isinstance(item, QIconCategoryItem):
+                self._unindex_category(item)
                 self.categoryRemoved.emit(item)
 
     @Slot(QModelIndex, int, int)
@@ -114,25 +318,89 @@ class QIconPickerModel(QStandardItemModel):
             parent_item = self.itemFromIndex(parent)
 
             if isinstance(parent_item, QIconCategoryItem):
+                # Reading the children from the category item skips building an index per inserted row
+                child = parent_item.child
+                icon_inserted = self.iconInserted
                 for row in range(first, last + 1):
-                    child_index = self.index(row, 0, parent)
-                    child_item = self.itemFromIndex(child_index)
+                    child_item = child(row)
                     if isinstance(child_item, QIconItem):
-                        self.iconInserted.emit(parent_item, child_item)
+                        self._index_icon(parent_item, child_item)
+                        icon_inserted.emit(parent_item, child_item)
             return
 
         for row in range(first, last + 1):
             item = self.itemFromIndex(self.index(row, 0))
             if isinstance(item, QIconCategoryItem):
+                if item.category() not in self._category_items:
+                    self._index_category(item)
                 self.categoryInserted.emit(item)
 
+    @contextmanager
+    def batchUpdates(self) -> typing.Iterator[None]:
+        """
+        Groups several changes to the model into a single model reset.
+
+        Changes made inside the block do not emit row or category signals; views and proxies update once,
+        when the block exits. Nested blocks only reset the model when the outermost one exits.
+
+        Example:
+            with model.batchUpdates():
+                model.addCategory(...)
+                model.addIcons(...)
+        """
+        if self._batch_depth > 0:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self.beginResetModel()
+        were_signals_blocked = self.blockSignals(True)
+        self._batch_depth = 1
+        try:
+            yield
+        finally:
+            self._batch_depth = 0
+            self.blockSignals(were_signals_blocked)
+            self.endResetModel()
+
+    @contextmanager
+    def deferIconInsertions(self) -> typing.Iterator[None]:
+        """
+        Queues the icons added with addIcon and inserts them when the block exits.
+
+        Each category receives its queued icons with a single addIcons call, so restoring many recent or
+        favorite icons inserts one batch of rows per category instead of one row per icon.
+        Unlike batchUpdates, the model is not reset, so the views keep their state.
+
+        Example:
+            with model.deferIconInsertions():
+                for icon_text in saved_favorites:
+                    model.addIcon(QIconPickerModel.BaseCategory.Favorites, QIconItem(icon_text, True))
+        """
+        if self._deferred_icons is not None:
+            yield
+            return
+
+        self._deferred_icons = {}
+        try:
+            yield
+        finally:
+            deferred_icons = self._deferred_icons
+            self._deferred_icons = None
+            for category_name, icon_items in deferred_icons.items():
+                self.addIcons(category_name, icon_items.values())
+
     def populate(self,
-                 source: QIconPickerModel.PopulateSource,
+                 source: "QIconPickerModel.PopulateSource",
                  recent_category: bool = True,
                  favorite_category: bool = True,
                  ignored_categories: typing.Optional[typing.List[str]] = None) -> None:
         """
         Populates the model with the specified method and base categories if required.
+        The population is a single batch, see batchUpdates.
 
         Args:
             source: Source used to populate the model.
@@ -143,12 +411,13 @@ class QIconPickerModel(QStandardItemModel):
         Returns:
             None
         """
-        self.populate_base_categories(recent_category, favorite_category)
+        with self.batchUpdates():
+            self.populate_base_categories(recent_category, favorite_category)
 
-        if source == QIconPickerModel.PopulateSource.Emojis:
-            self.populate_with_emoji_icons(ignored_categories)
-        elif source == QIconPickerModel.PopulateSource.AwesomeIcons:
-            self.populate_with_awesome_icons(ignored_categories)
+            if source == QIconPickerModel.PopulateSource.Emojis:
+                self.populate_with_emoji_icons(ignored_categories)
+            elif source == QIconPickerModel.PopulateSource.AwesomeIcons:
+                self.populate_with_awesome_icons(ignored_categories)
 
     def populate_base_categories(self, recent_category: bool = True, favorite_category: bool = True) -> None:
         """
@@ -163,14 +432,10 @@ class QIconPickerModel(QStandardItemModel):
         """
 
         if recent_category:
-            icon = QThemeResponsiveIcon.fromAwesome(
-                "fa6s.clock-rotate-left", options=[{"scale_factor": 0.9}]
-            )
+            icon = _category_icon("fa6s.clock-rotate-left", 0.9)
             self.addCategory(QIconPickerModel.BaseCategory.Recents, QIconPickerModel.BaseCategory.Recents, icon)
         if favorite_category:
-            icon = QThemeResponsiveIcon.fromAwesome(
-                "fa6s.star", options=[{"scale_factor": 0.9}]
-            )
+            icon = _category_icon("fa6s.star", 0.9)
             self.addCategory(QIconPickerModel.BaseCategory.Favorites, QIconPickerModel.BaseCategory.Favorites, icon)
 
     # noinspection PyProtectedMember
@@ -188,32 +453,15 @@ class QIconPickerModel(QStandardItemModel):
         font_maps = qtawesome._resource["iconic"].charmap
         font_names = qtawesome._resource["iconic"].fontname
 
-        icons = {
-            "fa5": "fa5.font-awesome-logo-full",
-            "fa5s": "fa5s.font-awesome-logo-full",
-            "fa5b": "fa5b.font-awesome-flag",
-            "fa6": "fa6.font-awesome",
-            "fa6s": "fa6s.font-awesome",
-            "fa6b": "fa6b.font-awesome",
-            "mdi": "mdi.material-design",
-            "mdi6": "mdi6.material-design",
-            "ei": "ei.redux",
-            "ph": "ph.phosphor-logo",
-            "ri": "ri.remixicon-fill",
-            "msc": "mdi.microsoft-visual-studio"
-        }
-
         if ignored_categories is None:
             ignored_categories = []
 
         for font_collection, font_data in font_maps.items():
             if font_collection not in ignored_categories:
                 font_name = font_names[font_collection]
-                self.addCategory(font_name, font_collection, QThemeResponsiveIcon.fromAwesome(icons[font_collection]))
+                self.addCategory(font_name, font_collection, _category_icon(self._AWESOME_CATEGORY_ICONS[font_collection]))
 
-                for icon_name in font_data:
-                    item = QIconItem(f"{font_collection}.{icon_name}", True)
-                    self.addIcon(font_collection, item)
+                self.addIcons(font_collection, [QIconItem(f"{font_collection}.{icon_name}", True) for icon_name in font_data])
 
     def populate_with_emoji_icons(self, ignored_categories: typing.Optional[typing.List[str]] = None):
         """
@@ -222,55 +470,26 @@ class QIconPickerModel(QStandardItemModel):
         Iterates through the emoji database, groups emojis by category, and creates the hierarchical model structure.
         Compatible emojis are tracked for skin tone updates.
         """
-        if ignored_categories is None:
-            ignored_categories = []
+        skipped_categories = set(ignored_categories or ())
 
-        icons = {
-            QIconPickerModel.EmojiCategory.SmileysAndEmotion: "fa6s.face-smile",
-            QIconPickerModel.EmojiCategory.PeopleAndBody: "fa6s.user",
-            QIconPickerModel.EmojiCategory.AnimalsAndNature: "fa6s.leaf",
-            QIconPickerModel.EmojiCategory.FoodAndDrink: "fa6s.bowl-food",
-            QIconPickerModel.EmojiCategory.Symbols: "fa6s.heart",
-            QIconPickerModel.EmojiCategory.Activities: "fa6s.gamepad",
-            QIconPickerModel.EmojiCategory.Objects: "fa6s.lightbulb",
-            QIconPickerModel.EmojiCategory.TravelAndPlaces: "fa6s.bicycle",
-            QIconPickerModel.EmojiCategory.Flags: "fa6s.flag",
-        }
-
-        # 1. Add Categories in desired order (Standard Order + Specials)
-        # Note: The order defined in EmojiCategory Enum or the loop below dictates display order
-        # Adjust as needed. Here we follow a typical picker order.
-        categories_order = [
-            QIconPickerModel.EmojiCategory.SmileysAndEmotion,
-            QIconPickerModel.EmojiCategory.PeopleAndBody,
-            QIconPickerModel.EmojiCategory.AnimalsAndNature,
-            QIconPickerModel.EmojiCategory.FoodAndDrink,
-            QIconPickerModel.EmojiCategory.Activities,
-            QIconPickerModel.EmojiCategory.TravelAndPlaces,
-            QIconPickerModel.EmojiCategory.Objects,
-            QIconPickerModel.EmojiCategory.Symbols,
-            QIconPickerModel.EmojiCategory.Flags,
-        ]
-
-        for category in categories_order:
-            if category not in ignored_categories:
-                icon = QThemeResponsiveIcon.fromAwesome(
-                    icons[category], options=[{"scale_factor": 0.9}]
-                )
+        # 1. Add Categories in display order
+        for category in self._EMOJI_CATEGORIES_ORDER:
+            if category not in skipped_categories:
+                icon = _category_icon(self._EMOJI_CATEGORY_ICONS[category], 0.9)
                 self.addCategory(category, category, icon)
 
-        # 2. Add Emojis
-        for emoji_char in sorted(emoji_data, key=lambda e: e.sort_order):
-            if emoji_char.category == "Component" or emoji_char.category in ignored_categories:
-                continue
-
-            self.addIcon(emoji_char.category, QIconItem.fromEmojiChar(emoji_char))
+        # 2. Add Emojis, one batch per category
+        from_emoji_char = QIconItem.fromEmojiChar
+        for category, emoji_chars in _emoji_data_by_category().items():
+            if category not in skipped_categories:
+                self.addIcons(category, [from_emoji_char(emoji_char) for emoji_char in emoji_chars])
 
     def findIconInCategory(
         self, category_item: QIconCategoryItem, icon_text: str
     ) -> typing.Optional[QIconItem]:
         """
         Find a specific icon within a given category index.
+        Icons still queued by deferIconInsertions are found too, although they have no row yet.
 
         Args:
             category_item (QIconCategoryItem): The category to search in.
@@ -279,24 +498,11 @@ class QIconPickerModel(QStandardItemModel):
         Returns:
             Optional[QIconItem]: The found icon item, or None if not found.
         """
-        # match(start_index, role, value, hits, flags)
-        # Search starting from the first child of the category
-        start_index = self.index(0, 0, category_item.index())
-
-        # We only want direct children, so we don't use Qt.MatchChange.MatchRecursive.
-        matches = self.match(
-            start_index,
-            Qt.ItemDataRole.EditRole,
-            icon_text,
-            1,  # Number of results (1 to stop at the first)
-            Qt.MatchFlag.MatchExactly,
-        )
-
-        if matches:
-            item = self.itemFromIndex(matches[0])
-            if isinstance(item, QIconItem):
-                return item
-        return None
+        category_name = category_item.category()
+        icon_item = self._icon_items.get(category_name, {}).get(icon_text)
+        if icon_item is None and self._deferred_icons is not None:
+            icon_item = self._deferred_icons.get(category_name, {}).get(icon_text)
+        return icon_item
 
     def findIconInCategoryByName(
         self, category: str, icon_text: str
@@ -316,6 +522,46 @@ class QIconPickerModel(QStandardItemModel):
             return None
         return self.findIconInCategory(category_item, icon_text)
 
+    def hasIcon(self, category_name: str, icon_text: str) -> bool:
+        """
+        Check whether a category contains an icon, e.g. whether an icon is a favorite.
+        Icons still queued by deferIconInsertions are included.
+
+        Args:
+            category_name (str): The name of the category.
+            icon_text (str): The icon to look for.
+
+        Returns:
+            bool: True if the category exists and contains the icon.
+        """
+        if icon_text in self._icon_items.get(category_name, ()):
+            return True
+        return self._deferred_icons is not None and icon_text in self._deferred_icons.get(category_name, ())
+
+    def icons(self, category_name: str) -> typing.List[QIconItem]:
+        """
+        Get the icon items of a category, read from the lookup tables instead of the category rows.
+
+        Args:
+            category_name (str): The name of the category.
+
+        Returns:
+            List[QIconItem]: The icon items in the order they were added, empty if the category is not found.
+        """
+        return list(self._icon_items.get(category_name, {}).values())
+
+    def iconCount(self, category_name: str) -> int:
+        """
+        Get the number of icons in a category, without building the list returned by icons.
+
+        Args:
+            category_name (str): The name of the category.
+
+        Returns:
+            int: The number of icons, 0 if the category is not found.
+        """
+        return len(self._icon_items.get(category_name, ()))
+
     def findCategory(self, category_name: str) -> typing.Optional[QIconCategoryItem]:
         """
         Find a category by its name.
@@ -326,19 +572,7 @@ class QIconPickerModel(QStandardItemModel):
         Returns:
             Optional[QIconCategoryItem]: The category item, or None if not found.
         """
-        start_index = self.index(0, 0)
-        matches = self.match(
-            start_index,
-            Qt.ItemDataRole.UserRole,
-            category_name,
-            1,
-            Qt.MatchFlag.MatchExactly,
-        )
-        if matches:
-            item = self.itemFromIndex(matches[0])
-            if isinstance(item, QIconCategoryItem):
-                return item
-        return None
+        return self._category_items.get(category_name)
 
     def addCategory(self, text: str, name: str, icon: typing.Union[QIcon, QPixmap]) -> bool:
         """
@@ -357,6 +591,7 @@ class QIconPickerModel(QStandardItemModel):
 
         category_item = QIconCategoryItem(text, name, icon)
         self.appendRow(category_item)
+        self._index_category(category_item)
         return True
 
     def categories(self) -> typing.List[QIconCategoryItem]:
@@ -366,12 +601,8 @@ class QIconPickerModel(QStandardItemModel):
         Returns:
             List[QIconCategoryItem]: A list of all icon category items.
         """
-        category_items = []
-        for row in range(self.rowCount()):
-            item = self.item(row)
-            if isinstance(item, QIconCategoryItem):
-                category_items.append(item)
-        return category_items
+        # One item() call per row; the name index is not used because it does not track row order
+        return [item for item in map(self.item, range(self.rowCount())) if isinstance(item, QIconCategoryItem)]
 
     def removeCategory(self, name: str) -> bool:
         """
@@ -393,13 +624,14 @@ class QIconPickerModel(QStandardItemModel):
     def addIcon(self, category_name: str, item: QIconItem) -> bool:
         """
         Add an icon to a specific category.
+        Inside deferIconInsertions, the icon is queued and inserted when the block exits.
 
         Args:
             category_name (str): The name of the category.
             item (QIconItem): The icon item to add.
 
         Returns:
-            bool: True if added, False if category not found or icon already exists.
+            bool: True if added (or queued), False if category not found or icon already exists.
         """
         category_item = self.findCategory(category_name)
         if not category_item:
@@ -409,13 +641,51 @@ class QIconPickerModel(QStandardItemModel):
         if self.findIconInCategory(category_item, icon_text):
             return False
 
+        if self._deferred_icons is not None:
+            deferred_items = self._deferred_icons.setdefault(category_name, {})
+            return deferred_items.setdefault(icon_text, item) is item
+
         category_item.appendRow(item)
+        self._index_icon(category_item, item)
 
         return True
 
+    def addIcons(self, category_name: str, items: typing.Iterable[QIconItem]) -> int:
+        """
+        Add several icons to a specific category at once.
+
+        The icons are appended with a single row insertion, so views and proxies handle one change
+        instead of one per icon.
+
+        Args:
+            category_name (str): The name of the category.
+            items (Iterable[QIconItem]): The icon items to add.
+
+        Returns:
+            int: The number of icons added. Icons already in the category are skipped.
+        """
+        category_item = self.findCategory(category_name)
+        if not category_item:
+            return 0
+
+        icon_items = self._icon_items.get(category_name, {})
+        new_items: typing.Dict[str, QIconItem] = {}
+        for item in items:
+            icon_text = item.data(Qt.ItemDataRole.EditRole)
+            if icon_text not in icon_items and icon_text not in new_items:
+                new_items[icon_text] = item
+
+        if new_items:
+            category_item.appendRows(list(new_items.values()))
+            for item in new_items.values():
+                self._index_icon(category_item, item)
+
+        return len(new_items)
+
     def removeIcon(self, category_name: str, icon_text: str) -> bool:
         """
         Remove an icon from a specific category.
+        Icons still queued by deferIconInsertions are dropped from the queue.
 
         Args:
             category_name (str): The name of the category.
@@ -428,6 +698,9 @@ class QIconPickerModel(QStandardItemModel):
         if not category_item:
             return False
 
+        if self._deferred_icons is not None and self._deferred_icons.get(category_name, {}).pop(icon_text, None):
+            return True
+
         icon_item = self.findIconInCategory(category_item, icon_text)
         if not icon_item:
             return False
@@ -436,32 +709,162 @@ class QIconPickerModel(QStandardItemModel):
 
         return True
 
-    def setColorModifier(self, color_modifier: str) -> None:
+    def removeIcons(self, category_name: str, icon_texts: typing.Iterable[str]) -> int:
         """
-        Applies a color modifier to each QIconItem in the model. Emits the color modifier role.
+        Remove several icons from a specific category at once.
+
+        The icons are found through the lookup tables and adjacent rows are removed together,
+        from the last row up, so the rows still to be removed keep their positions.
+        Icons still queued by deferIconInsertions are dropped from the queue.
 
         Args:
-            color_modifier: The color modifier to apply.
+            category_name (str): The name of the category.
+            icon_texts (Iterable[str]): The icon character strings.
 
         Returns:
-            None
+            int: The number of icons removed. Icons not in the category are skipped.
+        """
+        category_item = self.findCategory(category_name)
+        if not category_item:
+            return 0
+
+        deferred_items = self._deferred_icons.get(category_name, {}) if self._deferred_icons is not None else {}
+        dropped = 0
+        rows = set()
+        for icon_text in icon_texts:
+            if deferred_items.pop(icon_text, None):
+                dropped += 1
+                continue
+            icon_item = self.findIconInCategory(category_item, icon_text)
+            if icon_item:
+                rows.add(icon_item.row())
+
+        last_row = None
+        count = 0
+        for row in sorted(rows, reverse=True):
+            if last_row is not None and row == last_row - count:
+                count += 1
+                continue
+            if last_row is not None:
+                category_item.removeRows(last_row - count + 1, count)
+            last_row = row
+            count = 1
+
+        if last_row is not None:
+            category_item.removeRows(last_row - count + 1, count)
+
+        return len(rows) + dropped
+
+    def setIcons(self, item_icons: typing.Iterable[typing.Tuple[QIconItem, typing.Union[QIcon, QPixmap]]]) -> None:
         """
+        Sets the icons (DecorationRole) of several items at once.
 
-        start = time.perf_counter()
+        Like setColorModifier, the items are changed with signals blocked and announced with one dataChanged
+        per run of adjacent rows, instead of one notification per item.
 
-        for row in range(self.rowCount()):
-            category_item = self.item(row)
+        Args:
+            item_icons (Iterable[Tuple[QIconItem, Union[QIcon, QPixmap]]]): The items and their new icons.
+        """
+        changed_rows: typing.Dict[int, typing.Tuple[QIconCategoryItem, typing.Set[int]]] = {}
+
+        were_signals_blocked = self.blockSignals(True)
+        try:
+            for item, icon in item_icons:
+                item.setIcon(icon)
+                category_item = item.parent()
+                if category_item is not None:
+                    changed_rows.setdefault(id(category_item), (category_item, set()))[1].add(item.row())
+        finally:
+            self.blockSignals(were_signals_blocked)
+
+        roles = [Qt.ItemDataRole.DecorationRole]
+        for category_item, rows in changed_rows.values():
+            sorted_rows = sorted(rows)
+            first_row = previous_row = sorted_rows[0]
+            for row in sorted_rows[1:] + [None]:
+                if row is not None and row == previous_row + 1:
+                    previous_row = row
+                    continue
+                self.dataChanged.emit(category_item.child(first_row).index(), category_item.child(previous_row).index(), roles)
+                first_row = previous_row = row
+
+    def clearIcons(self) -> None:
+        """
+        Drops the icons (DecorationRole) of every icon item, releasing their pixmaps.
+
+        Views showing the model request the icons again as items are painted, so only the visible ones
+        are loaded back. Announced with one dataChanged per category.
+        """
+        changed_categories: typing.List[QIconCategoryItem] = []
+
+        were_signals_blocked = self.blockSignals(True)
+        try:
+            for category_name, category_item in self._category_items.items():
+                icon_items = self._icon_items.get(category_name)
+                if not icon_items:
+                    continue
+
+                for item in icon_items.values():
+                    item.setData(None, Qt.ItemDataRole.DecorationRole)
+                changed_categories.append(category_item)
+        finally:
+            self.blockSignals(were_signals_blocked)
+
+        roles = [Qt.ItemDataRole.DecorationRole]
+        for category_item in changed_categories:
+            last_row = category_item.rowCount() - 1
+            self.dataChanged.emit(category_item.child(0).index(), category_item.child(last_row).index(), roles)
 
-            if not isinstance(category_item, QIconCategoryItem):
-                continue
+    def setColorModifier(self, color_modifier: str) -> None:
+        """
+        Applies a color modifier to each QIconItem in the model supporting it. Emits the color modifier role.
 
-            for child_row in range(category_item.rowCount()):
-                item = category_item.child(child_row)
+        Item changes are made with signals blocked and announced with one dataChanged per category,
+        so views and proxies process a few ranges instead of one notification per icon.
 
-                if isinstance(item, QIconItem) and item.data(QIconItem.QIconItemDataRole.SupportColorModifier):
-                    item.setData(color_modifier, QIconItem.QIconItemDataRole.ColorModifierRole)
-                    self.colorChanged.emit(item.index())
-                    logging.debug("Defined ColorModifierRole for {}".format(item.data(Qt.ItemDataRole.EditRole)))
+        Args:
+            color_modifier: The color modifier to apply.
+
+        Returns:
+            None
+        """
+
+        start = time.perf_counter()
+        is_debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        changed_items: typing.List[QIconItem] = []
+        changed_ranges: typing.List[typing.Tuple[QIconCategoryItem, int, int]] = []
+
+        # Loop invariants, looked up once instead of once per icon
+        color_modifier_role = QIconItem.QIconItemDataRole.ColorModifierRole
+        append_changed_item = changed_items.append
+
+        were_signals_blocked = self.blockSignals(True)
+        try:
+            # Only the icons supporting a color modifier are visited, the lookup tables keep them apart
+            for category_name, category_item in self._category_items.items():
+                color_modifier_items = self._color_modifier_items.get(category_name)
+                if not color_modifier_items:
+                    continue
+
+                rows = []
+                for item in color_modifier_items.values():
+                    item.setData(color_modifier, color_modifier_role)
+                    append_changed_item(item)
+                    rows.append(item.row())
+
+                changed_ranges.append((category_item, min(rows), max(rows)))
+        finally:
+            self.blockSignals(were_signals_blocked)
+
+        roles = [color_modifier_role]
+        for category_item, first_row, last_row in changed_ranges:
+            self.dataChanged.emit(category_item.child(first_row).index(), category_item.child(last_row).index(), roles)
+
+        for item in changed_items:
+            self.colorChanged.emit(item.index())
+            if is_debug_enabled:
+                logging.debug("Defined ColorModifierRole for %s", item.data(Qt.ItemDataRole.EditRole))
 
         end = time.perf_counter()
-        logging.debug(f"Finished setColorModifier in {end - start:.6f} seconds.")
+        logging.debug("Finished setColorModifier in %.6f seconds.", end - start)
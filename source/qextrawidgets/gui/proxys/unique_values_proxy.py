@@ -82,11 +82,3 @@ class QUniqueValuesProxyModel(QSortFilterProxyModel):
             if val not in seen_values:
                 seen_values.add(val)
                 self._unique_rows.add(row)
-
-    def data(
-        self,
-        index: typing.Union[QModelIndex, QPersistentModelIndex],
-        role: int = Qt.ItemDataRole.DisplayRole,
-    ) -> typing.Any:
-        # We might want to override data to potentially format stuff, but default proxy behavior is fine.
-        return super().data(index, role)
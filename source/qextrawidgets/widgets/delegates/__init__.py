@@ -1,5 +1,7 @@
 from .grouped_icon_delegate import QGroupedIconDelegate
+from .multiple_roles_delegate import QMultipleRolesDelegate
 
 __all__ = [
     "QGroupedIconDelegate",
+    "QMultipleRolesDelegate",
 ]
@@ -2,18 +2,21 @@ from PySide6.QtCore import (
     QObject,
     Qt,
     QRect,
+    QSize,
     QModelIndex,
     QPersistentModelIndex,
     Signal,
     QTimer,
+    QMetaMethod,
 )
-from PySide6.QtGui import QPalette, QPainter, QIcon, QPixmap, QImage
+from PySide6.QtGui import QPalette, QPainter, QPen, QIcon, QPixmap, QImage
 from PySide6.QtWidgets import (
     QStyleOptionViewItem,
     QStyle,
     QStyledItemDelegate,
 )
 import typing
+from collections import OrderedDict
 
 
 class QGridIconDelegate(QStyledItemDelegate):
@@ -22,14 +25,25 @@ class QGridIconDelegate(QStyledItemDelegate):
     Renders items as rounded grid cells containing ONLY icons or pixmaps.
 
     Implements lazy loading signals for missing images.
+    Requests made while painting are collected and emitted together once control returns to the event loop,
+    so loading the images never runs inside a paint event.
 
     Attributes:
-        requestImage (Signal): Emitted when an item needs an image loaded.
+        requestImages (Signal): Emitted once per batch of items that need an image loaded.
+                                Sends a list of QPersistentModelIndex.
+        requestImage (Signal): Kept for compatibility. Emitted per item of a batch,
+                               only while something is connected to it.
                                Sends QPersistentModelIndex.
         _requested_indices (Set[QPersistentModelIndex]): Cache of indices that already requested an image.
+        _scaled_pixmaps (OrderedDict): LRU cache of pixmaps scaled to the item size,
+                                       keyed by (pixmap cache key, width, height).
     """
 
-    # Signal emitted when an item has no DecorationRole data
+    # Maximum number of scaled pixmaps kept between paints
+    ScaledPixmapCacheSize = 2048
+
+    # Signals emitted when items have no DecorationRole data
+    requestImages = Signal(list)
     requestImage = Signal(QPersistentModelIndex)
 
     def __init__(
@@ -46,6 +60,16 @@ class QGridIconDelegate(QStyledItemDelegate):
         """
         super().__init__(parent)
         self._requested_indices: typing.Set[QPersistentModelIndex] = set()
+        self._pending_indices: typing.List[QPersistentModelIndex] = []
+        self._scaled_pixmaps: typing.OrderedDict[typing.Tuple[int, int, int], QPixmap] = OrderedDict()
+        # Per item size: background and content rects relative to the item top left corner, and the content size
+        self._item_rects: typing.Dict[typing.Tuple[int, int], typing.Tuple[QRect, QRect, QSize]] = {}
+
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(0)
+        self._request_timer.timeout.connect(self._emit_pending_requests)
+
         self.setItemInternalMargin(item_internal_margin_ratio)
 
     def setItemInternalMargin(self, ratio: float) -> None:
@@ -56,6 +80,7 @@ class QGridIconDelegate(QStyledItemDelegate):
             ratio (float): A value between 0.0 (0%) and 0.5 (50%).
         """
         self._item_internal_margin_ratio = max(0.0, min(0.5, ratio))
+        self._item_rects = {}
 
     def itemInternalMargin(self) -> float:
         """
@@ -71,9 +96,51 @@ class QGridIconDelegate(QStyledItemDelegate):
         Clear the cache of ALL requested images.
 
         The next time the view paints a missing image item (e.g. on scroll or hover),
-        it will emit requestImage again.
+        it will request its image again.
         """
         self._requested_indices.clear()
+        self.clearCache()
+
+    def clearCache(self) -> None:
+        """
+        Clear the cache of pixmaps scaled to the item size.
+        """
+        self._scaled_pixmaps.clear()
+
+    def _scaled_pixmap(self, image: typing.Union[QPixmap, QImage], size: QSize) -> QPixmap:
+        """
+        Return the pixmap or image scaled to fit the size, reusing the result of previous paints.
+        The size is logical: the result keeps the device pixel ratio of the source, so HiDPI images
+        are scaled in device pixels and still fill the size.
+
+        Args:
+            image (Union[QPixmap, QImage]): The source pixmap or image.
+            size (QSize): The logical size to fit.
+
+        Returns:
+            QPixmap: The scaled pixmap.
+        """
+        key = (image.cacheKey(), size.width(), size.height())
+        scaled_pixmap = self._scaled_pixmaps.get(key)
+        if scaled_pixmap is not None:
+            self._scaled_pixmaps.move_to_end(key)
+            return scaled_pixmap
+
+        pixmap = QPixmap.fromImage(image) if isinstance(image, QImage) else image
+        # QPixmap.scaled takes device pixels and keeps the source ratio
+        device_pixel_ratio = pixmap.devicePixelRatio()
+        scaled_pixmap = pixmap.scaled(
+            size * device_pixel_ratio,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        scaled_pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        self._scaled_pixmaps[key] = scaled_pixmap
+        while len(self._scaled_pixmaps) > self.ScaledPixmapCacheSize:
+            self._scaled_pixmaps.popitem(last=False)
+
+        return scaled_pixmap
 
     def forceReload(self, index: QModelIndex) -> None:
         """
@@ -86,6 +153,51 @@ class QGridIconDelegate(QStyledItemDelegate):
         if persistent_index in self._requested_indices:
             self._requested_indices.remove(persistent_index)
 
+    def _emit_pending_requests(self) -> None:
+        """Emits the image requests collected since the last event loop iteration."""
+        pending_indices = self._pending_indices
+        self._pending_indices = []
+
+        pending_indices = [index for index in pending_indices if index.isValid()]
+        if not pending_indices:
+            return
+
+        self.requestImages.emit(pending_indices)
+
+        # The per item signal is only emitted for receivers still connected to it
+        if self.isSignalConnected(QMetaMethod.fromSignal(self.requestImage)):
+            for index in pending_indices:
+                self.requestImage.emit(index)
+
+    def _get_item_rects(self, option_rect: QRect) -> typing.Tuple[QRect, QRect, QSize]:
+        """
+        Return the background rect, the content rect and the content size of an item.
+
+        Grid items share one size, so the rects and the content size are computed once per size
+        and the rects translated to the item position.
+
+        Args:
+            option_rect (QRect): The item rect.
+
+        Returns:
+            Tuple[QRect, QRect, QSize]: The background rect, the content rect and the content size.
+        """
+        size_key = (option_rect.width(), option_rect.height())
+        item_rects = self._item_rects.get(size_key)
+
+        if item_rects is None:
+            rect = QRect(0, 0, size_key[0], size_key[1]).adjusted(2, 2, -2, -2)
+            margin = int(
+                min(rect.width(), rect.height()) * self._item_internal_margin_ratio
+            )
+            content_rect = rect.adjusted(margin, margin, -margin, -margin)
+            item_rects = (rect, content_rect, content_rect.size())
+            self._item_rects[size_key] = item_rects
+
+        x = option_rect.x()
+        y = option_rect.y()
+        return item_rects[0].translated(x, y), item_rects[1].translated(x, y), item_rects[2]
+
     def paint(
         self,
         painter: QPainter,
@@ -113,7 +225,7 @@ class QGridIconDelegate(QStyledItemDelegate):
         """
         Draw a child item in the grid used for lazy loading check.
 
-        Checks for DecorationRole; if missing, triggers requestImage signal.
+        Checks for DecorationRole; if missing, queues the item for the next requestImages batch.
         Renders the icon or pixmap centered in the item rect.
 
         Args:
@@ -137,7 +249,7 @@ class QGridIconDelegate(QStyledItemDelegate):
             bg_color = base_bg_color.lighter(120)
 
         # Draw Background (Rounded Rect)
-        rect = typing.cast(QRect, option.rect).adjusted(2, 2, -2, -2)
+        rect, target_rect, target_size = self._get_item_rects(typing.cast(QRect, option.rect))
 
         if bg_color is not None:
             painter.setPen(Qt.PenStyle.NoPen)
@@ -147,29 +259,22 @@ class QGridIconDelegate(QStyledItemDelegate):
         # Retrieve Data
         item_data = index.data(Qt.ItemDataRole.DecorationRole)
 
-        margin = int(
-            min(rect.width(), rect.height()) * self._item_internal_margin_ratio
-        )
-        target_rect = rect.adjusted(margin, margin, -margin, -margin)
-
         # --- Lazy Loading Logic ---
         # If no valid data is found, trigger the signal
-        is_data_valid = False
-        if item_data is not None:
-            if isinstance(item_data, (QIcon, QPixmap, QImage)) and not item_data.isNull():
-                is_data_valid = True
+        is_data_valid = isinstance(item_data, (QIcon, QPixmap, QImage)) and not item_data.isNull()
 
         # Check if we already requested this index to avoid spamming the signal in the paint loop
         p_index = QPersistentModelIndex(index)
         if p_index not in self._requested_indices:
             self._requested_indices.add(p_index)
-            self.requestImage.emit(p_index)
+            self._pending_indices.append(p_index)
+            if not self._request_timer.isActive():
+                self._request_timer.start()
             is_data_valid = False
 
         if not is_data_valid:
             # Optional: Draw a placeholder (e.g., a simple loading circle or gray box)
-            painter.setPen(Qt.PenStyle.DotLine)
-            painter.setPen(palette.color(QPalette.ColorRole.Mid))
+            painter.setPen(QPen(palette.color(QPalette.ColorRole.Mid), 1, Qt.PenStyle.DotLine))
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRoundedRect(target_rect, 4, 4)
 
@@ -191,21 +296,13 @@ class QGridIconDelegate(QStyledItemDelegate):
                 )
 
             elif isinstance(item_data, (QPixmap, QImage)):
-                if isinstance(item_data, QImage):
-                    pixmap = QPixmap.fromImage(item_data)
-                else:
-                    pixmap = item_data
-
-                scaled_pixmap = pixmap.scaled(
-                    target_rect.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+                scaled_pixmap = self._scaled_pixmap(item_data, target_size)
+                scaled_size = scaled_pixmap.deviceIndependentSize().toSize()
 
-                x = target_rect.x() + (target_rect.width() - scaled_pixmap.width()) // 2
+                x = target_rect.x() + (target_rect.width() - scaled_size.width()) // 2
                 y = (
                     target_rect.y()
-                    + (target_rect.height() - scaled_pixmap.height()) // 2
+                    + (target_rect.height() - scaled_size.height()) // 2
                 )
 
                 if not (current_state & QStyle.StateFlag.State_Enabled):
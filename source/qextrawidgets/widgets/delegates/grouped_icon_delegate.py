@@ -31,6 +31,9 @@ class QGroupedIconDelegate(QGridIconDelegate):
         """
         super().__init__(parent, item_internal_margin_ratio=item_internal_margin_ratio)
         self._arrow_icon: QIcon = arrow_icon if arrow_icon else QIcon()
+        # Bold header font, built once for the view font it was derived from
+        self._category_source_font: typing.Optional[QFont] = None
+        self._category_font = QFont()
 
     def setArrowIcon(self, icon: QIcon) -> None:
         """
@@ -77,6 +80,22 @@ class QGroupedIconDelegate(QGridIconDelegate):
 
         painter.restore()
 
+    def _get_category_font(self, font: QFont) -> QFont:
+        """
+        Return the bold font used for category headers, reusing it while the view font stays the same.
+
+        Args:
+            font (QFont): The font of the style option.
+
+        Returns:
+            QFont: The header font.
+        """
+        if font != self._category_source_font:
+            self._category_source_font = QFont(font)
+            self._category_font = QFont(font)
+            self._category_font.setBold(True)
+        return self._category_font
+
     def _draw_category(
         self,
         painter: QPainter,
@@ -163,9 +182,7 @@ class QGroupedIconDelegate(QGridIconDelegate):
             option_rect.height(),
         )
         painter.setPen(palette.color(QPalette.ColorRole.ButtonText))
-        font = typing.cast(QFont, option.font)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._get_category_font(typing.cast(QFont, option.font)))
         text = str(index.data(Qt.ItemDataRole.DisplayRole))
         style.drawItemText(
             painter,
@@ -0,0 +1,128 @@
+import typing
+
+from PySide6.QtCore import QObject, Qt, QModelIndex, QPersistentModelIndex, QSize
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QIcon, QImage, QPalette, QPixmap
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+
+class QMultipleRolesDelegate(QStyledItemDelegate):
+    """
+    Delegate that initializes its style option from a single data() call.
+
+    QStyledItemDelegate asks the model for each painting role separately, which means one
+    Python dispatch per role per row when the model is implemented in Python. This delegate
+    asks for a single role whose value is a dict of {role: value} and fills the style
+    option from it. Models that do not answer the role fall back to the default behavior.
+    """
+
+    def __init__(self, parent: typing.Optional[QObject] = None, multiple_roles_role: int = Qt.ItemDataRole.UserRole):
+        """
+        Initialize the delegate.
+
+        Args:
+            parent (Optional[QObject]): The parent object.
+            multiple_roles_role (int): The role answered with a dict of {role: value}.
+        """
+        super().__init__(parent)
+        self._multiple_roles_role = multiple_roles_role
+
+    def multipleRolesRole(self) -> int:
+        """
+        Get the role answered with a dict of {role: value}.
+
+        Returns:
+            int: The model role.
+        """
+        return self._multiple_roles_role
+
+    def initStyleOption(
+        self,
+        option: QStyleOptionViewItem,
+        index: typing.Union[QModelIndex, QPersistentModelIndex],
+    ) -> None:
+        """
+        Initialize the style option with the values fetched in one data() call.
+
+        Args:
+            option (QStyleOptionViewItem): The option to initialize.
+            index (QModelIndex): The index of the item.
+        """
+        values = index.data(self._multiple_roles_role)
+        if not isinstance(values, dict):
+            super().initStyleOption(option, index)
+            return
+
+        # Fields filled in by the view (state, rect, viewItemPosition...) are left as set,
+        # as QStyledItemDelegate::initStyleOption does.
+        setattr(option, "index", QModelIndex(index))
+
+        font = values.get(Qt.ItemDataRole.FontRole)
+        if isinstance(font, QFont):
+            resolved_font = font.resolve(typing.cast(QFont, option.font))
+            setattr(option, "font", resolved_font)
+            setattr(option, "fontMetrics", QFontMetrics(resolved_font))
+
+        alignment = values.get(Qt.ItemDataRole.TextAlignmentRole)
+        if alignment is not None:
+            setattr(option, "displayAlignment", Qt.AlignmentFlag(int(alignment)))
+
+        foreground = values.get(Qt.ItemDataRole.ForegroundRole)
+        if isinstance(foreground, (QBrush, QColor, Qt.GlobalColor)):
+            palette = typing.cast(QPalette, option.palette)
+            palette.setBrush(QPalette.ColorRole.Text, QBrush(foreground))
+            setattr(option, "palette", palette)
+
+        features = typing.cast(QStyleOptionViewItem.ViewItemFeature, option.features)
+
+        check_state = values.get(Qt.ItemDataRole.CheckStateRole)
+        if check_state is not None:
+            features |= QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+            setattr(option, "checkState", Qt.CheckState(check_state))
+
+        decoration = values.get(Qt.ItemDataRole.DecorationRole)
+        if decoration is not None:
+            features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+            decoration_size = typing.cast(QSize, option.decorationSize)
+            if isinstance(decoration, QIcon):
+                if decoration.isNull():
+                    features &= ~QStyleOptionViewItem.ViewItemFeature.HasDecoration
+                else:
+                    setattr(option, "icon", decoration)
+                    state = typing.cast(QStyle.StateFlag, option.state)
+                    if not state & QStyle.StateFlag.State_Enabled:
+                        mode = QIcon.Mode.Disabled
+                    elif state & QStyle.StateFlag.State_Selected:
+                        mode = QIcon.Mode.Selected
+                    else:
+                        mode = QIcon.Mode.Normal
+                    icon_state = QIcon.State.On if state & QStyle.StateFlag.State_Open else QIcon.State.Off
+                    # HiDPI icons may report a larger size than asked for; clamp it to decorationSize
+                    setattr(option, "decorationSize", decoration_size.boundedTo(
+                        decoration.actualSize(decoration_size, mode, icon_state)
+                    ))
+            elif isinstance(decoration, QPixmap):
+                setattr(option, "icon", QIcon(decoration))
+                setattr(option, "decorationSize", decoration.deviceIndependentSize().toSize())
+            elif isinstance(decoration, QImage):
+                setattr(option, "icon", QIcon(QPixmap.fromImage(decoration)))
+                setattr(option, "decorationSize", decoration.deviceIndependentSize().toSize())
+            elif isinstance(decoration, (QColor, Qt.GlobalColor)):
+                pixmap = QPixmap(decoration_size)
+                pixmap.fill(QColor(decoration))
+                setattr(option, "icon", QIcon(pixmap))
+
+        display = values.get(Qt.ItemDataRole.DisplayRole)
+        if display is not None:
+            features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            setattr(option, "text", self.displayText(display, option.locale))
+
+        setattr(option, "features", features)
+
+        background = values.get(Qt.ItemDataRole.BackgroundRole)
+        if isinstance(background, (QBrush, QColor, Qt.GlobalColor)):
+            setattr(option, "backgroundBrush", QBrush(background))
+        else:
+            setattr(option, "backgroundBrush", QBrush())
+
+        # Disable style animations for check boxes within item views, as QStyledItemDelegate does
+        setattr(option, "styleObject", None)
@@ -1,7 +1,7 @@
 import typing
 
 from PySide6 import QtCore
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QAbstractItemModel, Slot
+from PySide6.QtCore import Qt, QAbstractItemModel, Slot, QTimer
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QVBoxLayout,
@@ -18,10 +18,8 @@ from PySide6.QtWidgets import (
 )
 
 from qextrawidgets.gui.icons import QThemeResponsiveIcon
-from qextrawidgets.gui.proxys import (
-    QCheckStateProxyModel,
-    QUniqueValuesProxyModel,
-)
+from qextrawidgets.gui.models import QFilteredUniqueCheckedListModel
+from qextrawidgets.widgets.delegates import QMultipleRolesDelegate
 
 
 class QFilterPopup(QDialog):
@@ -74,6 +72,11 @@ class QFilterPopup(QDialog):
         self._search_field.setPlaceholderText(self.tr("Search..."))
         self._search_field.setClearButtonEnabled(True)
 
+        # Typing bursts are collapsed into a single filter pass over the unique values
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+
         self._check_all_box = QCheckBox(self.tr("(Select All)"))
         self._check_all_box.setTristate(True)
         self._check_all_box.setCheckState(Qt.CheckState.Checked)
@@ -129,36 +132,30 @@ class QFilterPopup(QDialog):
         return tool_button
 
     def _setup_model(self, model: QAbstractItemModel, column: int) -> None:
-        """Sets up the data model and proxy chain for the list view."""
-        # 1. Unique Values Proxy (Filters source to show only unique rows for the column)
-        self._unique_proxy = QUniqueValuesProxyModel(self)
-        self._unique_proxy.setSourceModel(model)
-        self._unique_proxy.setTargetColumn(column)
-
-        # 2. Check State Proxy (Adds checkbox state to the unique rows)
-        self._check_proxy = QCheckStateProxyModel(self)
-        self._check_proxy.setSourceModel(self._unique_proxy)
-        self._check_proxy.setInitialCheckState(Qt.CheckState.Checked)
-
-        # 3. Sort Proxy (Allows searching/sorting within the popup)
-        self._proxy_model = QSortFilterProxyModel(self)
-        self._proxy_model.setSourceModel(self._check_proxy)
-        self._proxy_model.setFilterKeyColumn(column)
-
-        # Filters and Sorting settings
-        self._proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._proxy_model.setFilterRole(Qt.ItemDataRole.DisplayRole)
-        self._proxy_model.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._proxy_model.setDynamicSortFilter(True)
-        self._proxy_model.sort(column, Qt.SortOrder.AscendingOrder)
-
-        self._list_view.setModel(self._proxy_model)
-        # Ensure we show the correct column in the list view (as it's a table model potentially)
-        self._list_view.setModelColumn(column)
+        """Sets up the unique values model for the list view."""
+        self._column = column
+
+        # Unique values of the column with their check states, filtered and sorted in one model
+        self._values_model = QFilteredUniqueCheckedListModel(self)
+        self._values_model.setInitialCheckState(Qt.CheckState.Checked)
+        self._values_model.setTargetColumn(column)
+        self._values_model.setSourceModel(model)
+        self._values_model.sort(0, Qt.SortOrder.AscendingOrder)
+
+        self._list_view.setModel(self._values_model)
+        # Fetch every painting role of a row with a single call into the Python model
+        self._list_view.setItemDelegate(
+            QMultipleRolesDelegate(
+                self._list_view,
+                QFilteredUniqueCheckedListModel.QFilteredUniqueCheckedListRole.MultipleRolesRole,
+            )
+        )
 
     def _setup_connections(self) -> None:
         """Sets up signals and slots connections."""
-        self._search_field.textChanged.connect(self._proxy_model.setFilterFixedString)
+        self._search_timer.timeout.connect(self._apply_search)
+        self._search_field.textChanged.connect(self._search_timer.start)
+        self._search_field.returnPressed.connect(self._apply_search)
         self._cancel_button.clicked.connect(self.reject)
         self._order_button.clicked.connect(self.reject)
         self._reverse_orden_button.clicked.connect(self.reject)
@@ -166,38 +163,33 @@ class QFilterPopup(QDialog):
         self._apply_button.clicked.connect(self.accept)
 
         self._check_all_box.clicked.connect(self._on_check_all_clicked)
-        self._proxy_model.dataChanged.connect(self._update_select_all_state)
+        self._values_model.dataChanged.connect(self._update_select_all_state)
 
         self._order_button.clicked.connect(
             lambda: self.orderChanged.emit(
-                self._proxy_model.filterKeyColumn(), Qt.SortOrder.AscendingOrder
+                self._column, Qt.SortOrder.AscendingOrder
             )
         )
         self._reverse_orden_button.clicked.connect(
             lambda: self.orderChanged.emit(
-                self._proxy_model.filterKeyColumn(), Qt.SortOrder.DescendingOrder
+                self._column, Qt.SortOrder.DescendingOrder
             )
         )
 
+    @Slot()
+    def _apply_search(self) -> None:
+        """Filters the values with the search text, cancelling a pending debounced search."""
+        self._search_timer.stop()
+        self._values_model.setFilterFixedString(self._search_field.text())
+
     def _on_check_all_clicked(self) -> None:
         """Handles clicking the 'Select All' checkbox."""
+        # The visible values must match the search text before they are checked
+        self._apply_search()
         state = self._check_all_box.checkState()
 
         # When clicking "Select All", we only affect what is VISIBLE in the search
-        # We need to iterate over visible rows in the SortProxy
-        row_count = self._proxy_model.rowCount()
-        column = self._proxy_model.filterKeyColumn()  # Should be our target column
-
-        for row in range(row_count):
-            # Map from sort proxy to check proxy
-            sort_index = self._proxy_model.index(row, column)
-            check_index = self._proxy_model.mapToSource(sort_index)
-
-            if check_index.isValid():
-                self._check_proxy.setData(
-                    check_index, state, Qt.ItemDataRole.CheckStateRole
-                )
-
+        self._values_model.setVisibleCheckState(state)
         self._check_all_box.setCheckState(state)
 
     @Slot()
@@ -205,24 +197,12 @@ class QFilterPopup(QDialog):
         """Updates the state of the 'Select All' checkbox based on items.
 
         """
-        checked_count = 0
-        total_count = self._proxy_model.rowCount()
+        total_count = self._values_model.rowCount()
 
         if total_count == 0:
             return
 
-        for row in range(total_count):
-            column = self._proxy_model.filterKeyColumn()
-            proxy_idx = self._proxy_model.index(row, column)
-            check_state = self._proxy_model.data(
-                proxy_idx, Qt.ItemDataRole.CheckStateRole
-            )
-
-            if not isinstance(check_state, Qt.CheckState):
-                check_state = Qt.CheckState(check_state)
-
-            if check_state == Qt.CheckState.Checked:
-                checked_count += 1
+        checked_count = self._values_model.visibleCheckedCount()
 
         self._check_all_box.blockSignals(True)
         if checked_count == 0:
@@ -236,6 +216,7 @@ class QFilterPopup(QDialog):
     def _on_clear_clicked(self) -> None:
         """Handles the clear filter button click."""
         self._search_field.clear()
+        self._apply_search()
         self.clearRequested.emit()
         self.reject()
 
@@ -250,32 +231,18 @@ class QFilterPopup(QDialog):
     # --- Data API ---
 
     def accept(self) -> None:
+        # The selected data is read from the visible values, so a pending search is applied first
+        self._apply_search()
         super().accept()
         self._update_select_all_state()
 
     def getSelectedData(self) -> typing.Set[str]:
-        """Returns all checked items in the unique check proxy that are visible in the proxy model.
+        """Returns all checked values that are visible in the search.
 
         Returns:
             Set[str]: Set of checked item texts.
         """
-        data = set()
-        # Iterate over the proxy model (which contains visible values)
-        row_count = self._proxy_model.rowCount()
-        column = self._proxy_model.filterKeyColumn()
-
-        for row in range(row_count):
-            index = self._proxy_model.index(row, column)
-
-            check_state = self._proxy_model.data(index, Qt.ItemDataRole.CheckStateRole)
-            if not isinstance(data, Qt.CheckState):
-                check_state = Qt.CheckState(check_state)
-
-            if check_state == Qt.CheckState.Checked:
-                val = self._proxy_model.data(index, Qt.ItemDataRole.DisplayRole)
-                data.add(str(val))
-
-        return data
+        return self._values_model.visibleCheckedValues()
 
     def isFiltering(self) -> bool:
         """Checks if there is any unchecked item, indicating an active filter.
@@ -283,4 +250,4 @@ class QFilterPopup(QDialog):
         Returns:
             bool: True if any item is unchecked, False otherwise.
         """
-        return bool(self._unique_proxy.rowCount() - len(self.getSelectedData()))
+        return bool(self._values_model.uniqueCount() - len(self.getSelectedData()))
@@ -113,17 +113,7 @@ class QIconComboBox(QToolButton):
             self._current_index = index
             item = self._items[index]
 
-            if item['font']:
-                self.setFont(item['font'])
-            else:
-                self.setFont(self._panel.font())  # Reset to default font if none specified
-
-            if item['icon']:
-                self.setIcon(item['icon'])
-                self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-            elif item['text']:
-                self.setText(item['text'])
-                self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+            self._update_current_button(item)
 
             self.currentIndexChanged.emit(index)
             self.currentDataChanged.emit(item['data'])
@@ -132,6 +122,24 @@ class QIconComboBox(QToolButton):
             self.setIcon(QIcon())
             self.setText("")
 
+    def _update_current_button(self, item: dict) -> None:
+        """Shows the font, icon or text of the current item on the main button.
+
+        Args:
+            item (dict): The current item information.
+        """
+        if item['font']:
+            self.setFont(item['font'])
+        else:
+            self.setFont(self._panel.font())  # Reset to default font if none specified
+
+        if item['icon']:
+            self.setIcon(item['icon'])
+            self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
+        elif item['text']:
+            self.setText(item['text'])
+            self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+
     def currentIndex(self) -> int:
         """Returns the current index.
 
@@ -203,8 +211,9 @@ class QIconComboBox(QToolButton):
             if not self._items[index]['icon']:
                 btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
 
+            # Only the look of the current item changed, so its index and data are not emitted again
             if index == self._current_index:
-                self.setCurrentIndex(index)
+                self._update_current_button(self._items[index])
 
     def itemText(self, index: int) -> str:
         """Returns the text of the item at the given index.
@@ -244,8 +253,9 @@ class QIconComboBox(QToolButton):
                 if self._items[index]['text']:
                     btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
 
+            # Only the look of the current item changed, so its index and data are not emitted again
             if index == self._current_index:
-                self.setCurrentIndex(index)
+                self._update_current_button(self._items[index])
 
     def itemIcon(self, index: int) -> QIcon:
         """Returns the icon of the item at the given index.
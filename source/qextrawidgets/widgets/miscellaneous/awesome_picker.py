@@ -2,13 +2,40 @@ import random
 import typing
 
 import qtawesome
-from PySide6.QtGui import QPixmap, Qt
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap, Qt, QPalette, QPixmapCache
 
 from qextrawidgets.gui.items.icon_item import QIconItem
 from qextrawidgets.gui.models.icon_picker_model import QIconPickerModel
 from qextrawidgets.widgets.miscellaneous.icon_picker import QIconPicker
 
 
+def _awesome_pixmap(name: str, color: str, width: int, height: int, dpr: float) -> QPixmap:
+    """
+    Renders a QtAwesome icon into a pixmap.
+    Cached in QPixmapCache only by the values that change the result, so every picker shares the rendered
+    glyphs and repaints skip building a new QIcon and rasterizing the glyph again.
+
+    Args:
+        name: QtAwesome icon name.
+        color: Icon color name.
+        width: Target logical width.
+        height: Target logical height.
+        dpr: Device pixel ratio of the screen showing the pixmap.
+
+    Returns:
+        The rendered pixmap.
+    """
+    cache_key = f"qtawesome:{name}:{color}:{width}x{height}:{dpr}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(cache_key, pixmap):
+        return pixmap
+
+    pixmap = qtawesome.icon(name, color=color).pixmap(QSize(width, height), dpr)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
 class QAwesomePicker(QIconPicker):
     def __init__(self, parent = None, model: typing.Optional[QIconPickerModel] = None, icon_label_size: int = 32):
         """
@@ -23,7 +50,7 @@ class QAwesomePicker(QIconPicker):
         if model is None:
             model = QIconPickerModel(QIconPickerModel.PopulateSource.AwesomeIcons)
 
-        super().__init__(parent, model, icon_label_size)
+        super().__init__(parent, model, icon_label_size, self.awesomePixmapGetter)
 
         qtawesome._instance()
         font_maps = qtawesome._resource["iconic"].charmap
@@ -55,15 +82,20 @@ class QAwesomePicker(QIconPicker):
             icon_item = QIconItem(random_icon, True, color_modifier=color)
             self.addColorOption(icon_item)
 
-    def iconPixmapGetter(self) -> typing.Callable[[QIconItem], QPixmap]:
-        """Define the icon getter that returns the icon pixmap from QtAwesome."""
+    def awesomePixmapGetter(self, item: QIconItem) -> QPixmap:
+        """
+        Icon pixmap getter that renders the icon with QtAwesome, in its color modifier if any.
+
+        Args:
+            item: The QIconItem instance which have the icon name.
+
+        Returns:
+            The icon pixmap.
+        """
         view = self.view()
-        def getter(item: QIconItem) -> QPixmap:
-            name = item.data(Qt.ItemDataRole.EditRole)
-            color = item.data(QIconItem.QIconItemDataRole.ColorModifierRole)
-            if color:
-                icon = qtawesome.icon(name, color=color)
-            else:
-                icon = qtawesome.icon(name)
-            return icon.pixmap(view.iconSize())
-        return getter
+        color = item.data(QIconItem.QIconItemDataRole.ColorModifierRole)
+        if not color:
+            # Same default as QtAwesome, resolved here so it takes part in the cache key
+            color = view.palette().color(QPalette.ColorRole.Text).name()
+        icon_size = view.iconSize()
+        return _awesome_pixmap(item.data(Qt.ItemDataRole.EditRole), color, icon_size.width(), icon_size.height(), self._device_pixel_ratio)
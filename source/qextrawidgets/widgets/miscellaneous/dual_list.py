@@ -1,7 +1,10 @@
+import bisect
+import itertools
+
 from PySide6.QtCore import Slot
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QStringListModel, QSortFilterProxyModel, QModelIndex
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QWidget, QListWidget, QAbstractItemView, QPushButton, QLineEdit, QLabel, QGroupBox, \
+from PySide6.QtWidgets import QWidget, QListView, QAbstractItemView, QPushButton, QLineEdit, QLabel, QGroupBox, \
     QVBoxLayout, QHBoxLayout
 import typing
 
@@ -28,6 +31,9 @@ class QDualList(QWidget):
         """
         super().__init__(parent)
 
+        # Set while _transfer_rows edits the models, so selectionChanged is emitted once per transfer
+        self._transferring_rows = False
+
         # --- 1. Interface Construction (Directly in __init__) ---
 
         main_layout = QHBoxLayout(self)
@@ -41,7 +47,16 @@ class QDualList(QWidget):
             container_layout_l = QVBoxLayout(self._available_container)
 
         self._search_input = self._create_search_input()
-        self._list_available = self._create_list_widget()
+        self._list_available = self._create_list_view()
+
+        # Available items are filtered by the proxy, which also keeps them sorted after drops
+        self._available_model = QStringListModel(self)
+        self._available_proxy = QSortFilterProxyModel(self)
+        self._available_proxy.setSourceModel(self._available_model)
+        self._available_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._available_proxy.setDynamicSortFilter(True)
+        self._available_proxy.sort(0, Qt.SortOrder.AscendingOrder)
+        self._list_available.setModel(self._available_proxy)
 
         container_layout_l.addWidget(self._search_input)
         container_layout_l.addWidget(self._list_available)
@@ -67,7 +82,9 @@ class QDualList(QWidget):
         if not container_layout_r:
             container_layout_r = QVBoxLayout(self._selected_container)
 
-        self._list_selected = self._create_list_widget()
+        self._list_selected = self._create_list_view()
+        self._selected_model = QStringListModel(self)
+        self._list_selected.setModel(self._selected_model)
         self._lbl_count = self._create_label(self.tr("0 items"))
 
         container_layout_r.addWidget(self._list_selected)
@@ -97,20 +114,22 @@ class QDualList(QWidget):
         return box
 
     @staticmethod
-    def _create_list_widget() -> QListWidget:
-        """Creates the default list widget (QListWidget).
+    def _create_list_view() -> QListView:
+        """Creates the default list view (QListView).
 
         Returns:
-            QListWidget: The created list widget.
+            QListView: The created list view.
         """
-        list_widget = QListWidget()
-        list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        list_widget.setDragEnabled(True)
-        list_widget.setAcceptDrops(True)
-        list_widget.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
-        list_widget.setDefaultDropAction(Qt.DropAction.MoveAction)
-        list_widget.setAlternatingRowColors(True)
-        return list_widget
+        list_view = QListView()
+        list_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        list_view.setUniformItemSizes(True)
+        list_view.setDragEnabled(True)
+        list_view.setAcceptDrops(True)
+        list_view.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
+        list_view.setDefaultDropAction(Qt.DropAction.MoveAction)
+        list_view.setAlternatingRowColors(True)
+        return list_view
 
     @staticmethod
     def _create_button(icon: QIcon) -> QPushButton:
@@ -162,64 +181,123 @@ class QDualList(QWidget):
         self._btn_move_all_left.clicked.connect(lambda: self._move_all_items(self._list_selected, self._list_available))
 
         # Double Click
-        self._list_available.itemDoubleClicked.connect(
+        self._list_available.doubleClicked.connect(
             lambda: self._move_items(self._list_available, self._list_selected))
-        self._list_selected.itemDoubleClicked.connect(
+        self._list_selected.doubleClicked.connect(
             lambda: self._move_items(self._list_selected, self._list_available))
 
         # Filter
-        self._search_input.textChanged.connect(self._filter_available_items)
+        self._search_input.textChanged.connect(self._available_proxy.setFilterFixedString)
 
         # Monitoring
-        self._list_selected.model().rowsInserted.connect(self._update_internal_count)
-        self._list_selected.model().rowsRemoved.connect(self._update_internal_count)
+        self._selected_model.rowsInserted.connect(self._update_internal_count)
+        self._selected_model.rowsRemoved.connect(self._update_internal_count)
+        self._selected_model.modelReset.connect(self._update_internal_count)
 
-    def _move_items(self, source_list: QListWidget, dest_list: QListWidget) -> None:
-        """Moves selected items from source list to destination list.
+    @staticmethod
+    def _string_model(view: QListView) -> QStringListModel:
+        """Returns the string list model behind a view, skipping the filter proxy if any.
 
         Args:
-            source_list (QListWidget): List to move items from.
-            dest_list (QListWidget): List to move items to.
+            view (QListView): The list view.
+
+        Returns:
+            QStringListModel: The source string list model.
         """
-        items = source_list.selectedItems()
-        for item in items:
-            source_list.takeItem(source_list.row(item))
-            dest_list.addItem(item)
-        dest_list.sortItems()
-        self._update_internal_count()
+        model = view.model()
+        if isinstance(model, QSortFilterProxyModel):
+            model = model.sourceModel()
+        return typing.cast(QStringListModel, model)
 
-    def _move_all_items(self, source_list: QListWidget, dest_list: QListWidget) -> None:
-        """Moves all non-hidden items from source list to destination list.
+    @staticmethod
+    def _source_row(view: QListView, index: QModelIndex) -> int:
+        """Maps a view index to its row in the source string list model.
 
         Args:
-            source_list (QListWidget): List to move items from.
-            dest_list (QListWidget): List to move items to.
+            view (QListView): The list view owning the index.
+            index (QModelIndex): The view index.
+
+        Returns:
+            int: The row in the source string list model.
         """
-        for i in range(source_list.count() - 1, -1, -1):
-            item = source_list.item(i)
-            if not item.isHidden():
-                source_list.takeItem(i)
-                dest_list.addItem(item)
-        dest_list.sortItems()
+        model = view.model()
+        if isinstance(model, QSortFilterProxyModel):
+            index = model.mapToSource(index)
+        return index.row()
+
+    def _transfer_rows(self, source_view: QListView, dest_view: QListView, rows: typing.Iterable[int]) -> None:
+        """Moves the given source rows from one list to the other, keeping the destination sorted.
+
+        Runs of adjacent rows are removed and inserted with one removeRows/insertRows call each, so the
+        views keep their selection and scroll position instead of being reset.
+
+        Args:
+            source_view (QListView): List to move items from.
+            dest_view (QListView): List to move items to.
+            rows (Iterable[int]): Rows of the source string list model to move.
+        """
+        rows = sorted(set(rows))
+        if not rows:
+            return
+
+        source_model = self._string_model(source_view)
+        dest_model = self._string_model(dest_view)
+
+        source_values = source_model.stringList()
+        moved_values = sorted(source_values[row] for row in rows)
+        self._transferring_rows = True
+
+        runs: typing.List[typing.List[int]] = []
+        for row in rows:
+            if runs and runs[-1][0] + runs[-1][1] == row:
+                runs[-1][1] += 1
+            else:
+                runs.append([row, 1])
+
+        # Remove from the bottom up so the rows of the remaining runs stay valid
+        for start, count in reversed(runs):
+            source_model.removeRows(start, count)
+
+        # Values sharing an insertion point are inserted together, bottom up for the same reason
+        dest_values = dest_model.stringList()
+        insertions = itertools.groupby(moved_values, key=lambda value: bisect.bisect_right(dest_values, value))
+        for position, values in reversed([(position, list(values)) for position, values in insertions]):
+            dest_model.insertRows(position, len(values))
+            for offset, value in enumerate(values):
+                dest_model.setData(dest_model.index(position + offset, 0), value)
+
+        self._transferring_rows = False
         self._update_internal_count()
 
-    def _filter_available_items(self, text: str) -> None:
-        """Filters items in the available list based on text.
+    def _move_items(self, source_view: QListView, dest_view: QListView) -> None:
+        """Moves selected items from source list to destination list.
+
+        Args:
+            source_view (QListView): List to move items from.
+            dest_view (QListView): List to move items to.
+        """
+        indexes = source_view.selectionModel().selectedIndexes()
+        self._transfer_rows(source_view, dest_view, (self._source_row(source_view, index) for index in indexes))
+
+    def _move_all_items(self, source_view: QListView, dest_view: QListView) -> None:
+        """Moves all non-filtered items from source list to destination list.
 
         Args:
-            text (str): Filter text.
+            source_view (QListView): List to move items from.
+            dest_view (QListView): List to move items to.
         """
-        count = self._list_available.count()
-        for i in range(count):
-            item = self._list_available.item(i)
-            item.setHidden(text.lower() not in item.text().lower())
+        model = source_view.model()
+        rows = (self._source_row(source_view, model.index(row, 0)) for row in range(model.rowCount()))
+        self._transfer_rows(source_view, dest_view, rows)
 
     @Slot()
     def _update_internal_count(self) -> None:
         """Updates the selected items count and emits selectionChanged signal."""
-        count = self._list_selected.count()
-        self._lbl_count.setText(self.tr("{} items").format(count))
-        current_data = [self._list_selected.item(i).text() for i in range(count)]
+        if self._transferring_rows:
+            return
+
+        current_data = self._selected_model.stringList()
+        self._lbl_count.setText(self.tr("{} items").format(len(current_data)))
         self.selectionChanged.emit(current_data)
 
     # --- Public API (camelCase) ---
@@ -230,11 +308,8 @@ class QDualList(QWidget):
         Args:
             items (List[str]): List of strings to display in available list.
         """
-        self._list_available.clear()
-        self._list_selected.clear()
-        self._list_available.addItems(items)
-        self._list_available.sortItems()
-        self._update_internal_count()
+        self._available_model.setStringList(sorted(items))
+        self._selected_model.setStringList([])
 
     def getSelectedItems(self) -> typing.List[str]:
         """Returns the list of currently selected items.
@@ -242,14 +317,14 @@ class QDualList(QWidget):
         Returns:
             List[str]: List of selected strings.
         """
-        return [self._list_selected.item(i).text() for i in range(self._list_selected.count())]
+        return self._selected_model.stringList()
 
     def setSelectedItems(self, items: typing.List[str]) -> None:
         """Sets the list of selected items.
 
+        The items are shown sorted, as moved items are inserted in sorted order.
+
         Args:
             items (List[str]): List of strings to display in selected list.
         """
-        self._list_selected.clear()
-        self._list_selected.addItems(items)
-        self._update_internal_count()
+        self._selected_model.setStringList(sorted(items))
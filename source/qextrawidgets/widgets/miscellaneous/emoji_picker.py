@@ -3,8 +3,10 @@ import random
 import typing
 from enum import Enum
 from functools import lru_cache
+from itertools import islice
 
-from PySide6.QtGui import QPixmap, Qt, QFont, QIcon
+from PySide6.QtCore import QSize, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot, QPersistentModelIndex
+from PySide6.QtGui import QPixmap, Qt, QFont, QIcon, QImage, QPixmapCache, QShowEvent
 from emoji_data_python import EmojiChar, emoji_data
 
 from qextrawidgets.core.utils import QTwemojiImageProvider, QIconGenerator
@@ -46,13 +48,76 @@ class EmojiSkinTone(str, Enum):
     Dark = "1F3FF"
 
 
+# QPixmapCache size in KB recommended at a device pixel ratio of 1, enough to keep every emoji of the grid
+# decoded at the default icon size. Scaled by the squared device pixel ratio, as pixmaps are.
+_PIXMAP_CACHE_LIMIT = 32 * 1024
+
+# Thread pool priority of the images loaded ahead of time, below the images requested by the view
+_PREWARM_PRIORITY = -1
+
+# Number of emojis the prewarm looks up and queues at a time; the next chunk starts once these are loaded,
+# so the GUI thread never handles more than this many cache lookups or pixmap conversions in one go
+_PREWARM_CHUNK_SIZE = 128
+
+# (size, dpr) pairs whose images a picker has started loading ahead of time. QPixmapCache is shared by
+# every picker, so the other pickers skip their own prewarm.
+_prewarmed_sizes: typing.Set[typing.Tuple[int, float]] = set()
+
+# Skin tones offered by the selector, in display order
+_SKIN_TONES: typing.Tuple[EmojiSkinTone, ...] = tuple(EmojiSkinTone)
+
+# Modifier codes an emoji must provide to support skin tones, as plain strings so the check is
+# a single set comparison against the keys of EmojiChar.skin_variations
+_SKIN_TONE_MODIFIERS: typing.FrozenSet[str] = frozenset(
+    skin_tone.value for skin_tone in _SKIN_TONES if skin_tone != EmojiSkinTone.Default
+)
+
+
 @lru_cache(maxsize=None)
+def _emoji_chars_by_char() -> typing.Dict[str, EmojiChar]:
+    """
+    Index of the emoji database by character string, built once.
+    Building it converts every unified code once, while scanning the database converted them on each lookup.
+    """
+    emoji_chars: typing.Dict[str, EmojiChar] = {}
+    for emoji_char in emoji_data:
+        emoji_chars.setdefault(emoji_char.char, emoji_char)
+    return emoji_chars
+
+
 def _find_emoji_by_char(char: str) -> typing.Optional[EmojiChar]:
     """
     Find an EmojiChar object by its character string.
-    Cached for performance.
     """
-    return next((e for e in emoji_data if e.char == char), None)
+    return _emoji_chars_by_char().get(char)
+
+@lru_cache(maxsize=None)
+def _resolve_emoji_color(emoji: str, color_modifier: typing.Optional[str]) -> str:
+    """
+    Apply the skin tone color to an emoji.
+    Cached because EmojiChar.char converts the unified code on every access, and because returning
+    one string object per emoji and skin tone keeps its hash computed for the pixmap cache lookups.
+
+    Args:
+        emoji: Emoji string.
+        color_modifier: Emoji skin tone.
+
+    Returns:
+        The colored emoji, or an empty string if the emoji is unknown.
+    """
+    emoji_char = _find_emoji_by_char(emoji)
+    if emoji_char is None:
+        return ""
+
+    if color_modifier:
+        color_emoji = emoji_char.skin_variations.get(color_modifier)
+        if color_emoji is None:
+            logging.debug("Color %s not found for emoji %s", color_modifier, emoji)
+        else:
+            return color_emoji.char
+
+    return emoji
+
 
 def support_skin_tones(char: EmojiChar) -> bool:
     """
@@ -65,11 +130,114 @@ def support_skin_tones(char: EmojiChar) -> bool:
         If it supports skin tones, returns True.
     """
     if char.skin_variations:
-        return all(skin_tone in char.skin_variations for skin_tone in EmojiSkinTone if skin_tone != "")
+        return char.skin_variations.keys() >= _SKIN_TONE_MODIFIERS
 
     return False
 
 
+@lru_cache(maxsize=None)
+def _font_description(font_family: str) -> str:
+    """
+    Returns the QFont.toString() description of a font family.
+    Cached so getters given a family name do not build a QFont for every requested emoji.
+
+    Args:
+        font_family: Font family name.
+
+    Returns:
+        The font description.
+    """
+    return QFont(font_family).toString()
+
+
+@lru_cache(maxsize=None)
+def _font_from_description(font_description: str) -> QFont:
+    """
+    Parses a QFont.toString() description.
+    Cached so every emoji rendered with the same font reuses one parsed QFont;
+    QIconGenerator.charToPixmap copies the font before resizing it, so the cached one is never modified.
+
+    Args:
+        font_description: Font serialized with QFont.toString().
+
+    Returns:
+        The parsed font.
+    """
+    font = QFont()
+    font.fromString(font_description)
+    return font
+
+
+def _font_emoji_pixmap(emoji: str, font_description: str, width: int, height: int) -> QPixmap:
+    """
+    Renders an emoji with the given font into a pixmap.
+    Cached in QPixmapCache by (emoji, font, size), like the Twemoji pixmaps, so every picker shares the
+    rendered glyphs within one memory limit and scrolling back over the grid does not rasterize them again.
+
+    Args:
+        emoji: Emoji string.
+        font_description: Font serialized with QFont.toString().
+        width: Target width.
+        height: Target height.
+
+    Returns:
+        The rendered pixmap.
+    """
+    cache_key = f"emoji-font:{emoji}:{font_description}:{width}x{height}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(cache_key, pixmap):
+        return pixmap
+
+    pixmap = QIconGenerator.charToPixmap(emoji, QSize(width, height), _font_from_description(font_description))
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+@lru_cache(maxsize=None)
+def _skin_tone_emojis() -> typing.Tuple[str, ...]:
+    """
+    Returns every emoji character that supports all the skin tones.
+    Cached so the emoji database is scanned only once per process.
+    """
+    return tuple(emoji_char.char for emoji_char in emoji_data if support_skin_tones(emoji_char))
+
+
+class _TwemojiImageLoaderSignals(QObject):
+    """Signals of the Twemoji image loaders, emitted from worker threads and delivered to the GUI thread."""
+
+    loaded = Signal(str, int, float, QImage)
+
+
+class _TwemojiImageLoader(QRunnable):
+    """Loads a Twemoji image on a worker thread."""
+
+    def __init__(self, signals: _TwemojiImageLoaderSignals, emoji: str, size: int, dpr: float):
+        """
+        Initialize the loader.
+
+        Args:
+            signals: Object used to report the loaded image.
+            emoji: Emoji string, already resolved to its skin tone.
+            size: Target logical size.
+            dpr: Device pixel ratio.
+        """
+        super().__init__()
+        self._signals = signals
+        self._emoji = emoji
+        self._size = size
+        self._dpr = dpr
+
+    def run(self) -> None:
+        """Loads the image and reports it, or a null image if it could not be loaded."""
+        try:
+            image = QTwemojiImageProvider.getImage(self._emoji, 0, self._size, self._dpr)
+        except ValueError:
+            logging.debug("Twemoji image not found for %s", self._emoji)
+            image = QImage()
+
+        self._signals.loaded.emit(self._emoji, self._size, self._dpr, image)
+
+
 class QEmojiPicker(QIconPicker):
     def __init__(self,
                  parent = None,
@@ -91,20 +259,199 @@ class QEmojiPicker(QIconPicker):
         if icon_pixmap_getter is None:
             icon_pixmap_getter = self.emojiPixmapGetter
 
-        skin_tones = list(EmojiSkinTone)
-
-        emojis_with_color = [emoji_char.char for emoji_char in emoji_data if support_skin_tones(emoji_char)]
-        random_color_emoji = random.choice(emojis_with_color)
+        random_color_emoji = random.choice(_skin_tone_emojis())
 
         super().__init__(parent, model, icon_label_size, icon_pixmap_getter, ":{alias}:")
 
-        for color_modifier in skin_tones:
+        # Twemoji images requested by the view are decoded on worker threads.
+        # The pool is created first so it is destroyed, waiting for its threads, before the signals object.
+        self._image_pool = QThreadPool(self)
+        self._image_loader_signals = _TwemojiImageLoaderSignals(self)
+        self._image_loader_signals.loaded.connect(self._on_image_loaded)
+        # Images being loaded, by (emoji, size, dpr), with the source indexes waiting for them
+        self._pending_images: typing.Dict[typing.Tuple[str, int, float], typing.List[QPersistentModelIndex]] = {}
+        # Icon items still to be loaded ahead of time, and the images of the current prewarm chunk being loaded
+        self._prewarm_items: typing.Optional[typing.Iterator[QIconItem]] = None
+        self._prewarm_keys: typing.Set[typing.Tuple[str, int, float]] = set()
+
+        for color_modifier in _SKIN_TONES:
             icon_item = QIconItem(random_color_emoji, True, None, color_modifier)
             self.addColorOption(icon_item)
 
+    @staticmethod
+    def recommendedPixmapCacheLimit(device_pixel_ratio: float = 1.0) -> int:
+        """
+        Get the QPixmapCache limit that keeps every emoji of the grid decoded at the default icon size.
+
+        Emoji pixmaps are shared by every picker through QPixmapCache, whose default limit of 10 MB holds
+        fewer than half of them, so scrolling decodes evicted emojis again. The limit is global, so the picker
+        leaves it to the application:
+
+            QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), QEmojiPicker.recommendedPixmapCacheLimit(dpr)))
+
+        Args:
+            device_pixel_ratio (float, optional): Device pixel ratio of the screen showing the picker. Defaults to 1.0.
+
+        Returns:
+            int: The limit in KB, 32 MB scaled by the squared device pixel ratio.
+        """
+        return _PIXMAP_CACHE_LIMIT * max(1, round(device_pixel_ratio ** 2))
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Handle show events to start loading the emoji images ahead of the first scroll.
+        Only the first picker shown at a given icon size does it, since the pixmap cache is shared,
+        and only when the cache limit can hold the grid, as the loaded images would evict each other otherwise.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        if self._prewarm_items is not None or self.iconPixmapGetter() != self.emojiPixmapGetter:
+            return
+
+        if QPixmapCache.cacheLimit() < self.recommendedPixmapCacheLimit(self._device_pixel_ratio):
+            return
+
+        prewarm_size = (self.view().iconSize().height(), self._device_pixel_ratio)
+        if prewarm_size in _prewarmed_sizes:
+            return
+
+        _prewarmed_sizes.add(prewarm_size)
+        self._prewarm_items = (
+            item
+            for category_item in self._model.categories()
+            for item in map(category_item.child, range(category_item.rowCount()))
+            if isinstance(item, QIconItem)
+        )
+        QTimer.singleShot(0, self._prewarm_images)
+
+    @Slot()
+    def _prewarm_images(self) -> None:
+        """Loads the images of the next chunk of emojis on the worker threads, at a lower priority than
+        the images requested by the view, so scrolling finds them already in the pixmap cache.
+        The following chunk starts once these images are loaded, or on the next event loop pass
+        if they all were in the cache."""
+        if self._prewarm_items is None or self.iconPixmapGetter() != self.emojiPixmapGetter:
+            return
+
+        chunk = list(islice(self._prewarm_items, _PREWARM_CHUNK_SIZE))
+        if not chunk:
+            return
+
+        size = self.view().iconSize().height()
+        dpr = self._device_pixel_ratio
+
+        for item in chunk:
+            emoji = self.resolveEmojiColorByIcon(item)
+            if not emoji:
+                continue
+
+            key = (emoji, size, dpr)
+            if key in self._pending_images or QTwemojiImageProvider.findPixmap(emoji, 0, size, dpr) is not None:
+                continue
+
+            self._pending_images[key] = []
+            self._prewarm_keys.add(key)
+            self._image_pool.start(
+                _TwemojiImageLoader(self._image_loader_signals, emoji, size, dpr), _PREWARM_PRIORITY
+            )
+
+        if not self._prewarm_keys:
+            QTimer.singleShot(0, self._prewarm_images)
+
+    @Slot(list)
+    def _on_request_images(self, persistent_indexes: typing.List[QPersistentModelIndex]) -> None:
+        """Loads the emoji images requested by the delegate.
+
+        With the default Twemoji getter, images missing from the cache are decoded on worker threads and
+        set when they are ready, so scrolling never waits for the disk. Other getters run synchronously.
+
+        Args:
+            persistent_indexes (List[QPersistentModelIndex]): The persistent indexes of the items needing an image.
+        """
+        if self.iconPixmapGetter() != self.emojiPixmapGetter:
+            super()._on_request_images(persistent_indexes)
+            return
+
+        view = self.view()
+        size = view.iconSize().height()
+        dpr = self._device_pixel_ratio
+
+        # Images already in the cache are set together once every index is handled
+        cached_icons = []
+
+        for persistent_index in persistent_indexes:
+            if not persistent_index.isValid():
+                continue
+
+            item = self._item_from_proxy_index(persistent_index)
+            if item is None:
+                continue
+
+            emoji = self.resolveEmojiColorByIcon(item)
+            if not emoji:
+                continue
+
+            pixmap = QTwemojiImageProvider.findPixmap(emoji, 0, size, dpr)
+            if pixmap is not None:
+                cached_icons.append((item, pixmap))
+                continue
+
+            key = (emoji, size, dpr)
+            waiting_indexes = self._pending_images.get(key)
+            if waiting_indexes is None:
+                self._pending_images[key] = [QPersistentModelIndex(item.index())]
+                self._image_pool.start(_TwemojiImageLoader(self._image_loader_signals, emoji, size, dpr))
+            else:
+                if not waiting_indexes:
+                    # Only queued by the prewarm, behind the other emojis: load it again right away
+                    self._image_pool.start(_TwemojiImageLoader(self._image_loader_signals, emoji, size, dpr))
+                waiting_indexes.append(QPersistentModelIndex(item.index()))
+
+        self._model.setIcons(cached_icons)
+
+    @Slot(str, int, float, QImage)
+    def _on_image_loaded(self, emoji: str, size: int, dpr: float, image: QImage) -> None:
+        """Sets an image loaded by a worker thread on the items waiting for it.
+
+        Items whose skin tone changed while the image was loading are skipped; they request their new image.
+
+        Args:
+            emoji: Emoji string, already resolved to its skin tone.
+            size: Target logical size.
+            dpr: Device pixel ratio.
+            image: The loaded image, null if it could not be loaded.
+        """
+        key = (emoji, size, dpr)
+        waiting_indexes = self._pending_images.pop(key, [])
+        if key in self._prewarm_keys:
+            self._prewarm_keys.discard(key)
+            if not self._prewarm_keys:
+                QTimer.singleShot(0, self._prewarm_images)
+
+        if image.isNull():
+            logging.warning("Null pixmap generated for %s", emoji)
+            return
+
+        pixmap = QTwemojiImageProvider.insertPixmap(emoji, 0, size, dpr, image)
+        item_icons = []
+
+        for persistent_index in waiting_indexes:
+            if not persistent_index.isValid() or persistent_index.model() is not self._model:
+                continue
+
+            source_index = self._model.index(persistent_index.row(), persistent_index.column(), persistent_index.parent())
+            item = self._model.itemFromIndex(source_index)
+            if isinstance(item, QIconItem) and self.resolveEmojiColorByIcon(item) == emoji:
+                item_icons.append((item, pixmap))
+
+        self._model.setIcons(item_icons)
+
     def emojiPixmapGetter(self, icon: QIconItem) -> QPixmap:
         """
         Helper emoji pixmap getter based on read emoji icons from local source.
+        The image is decoded at the icon size of the view in device pixels, never larger.
 
         Args:
             icon: The QIconItem instance which have the emoji.
@@ -113,10 +460,11 @@ class QEmojiPicker(QIconPicker):
             Emoji pixmap getter function.
         """
         emoji = self.resolveEmojiColorByIcon(icon)
-        if emoji is None:
+        if not emoji:
             return QPixmap()
 
-        return QTwemojiImageProvider.getPixmap(emoji, 0, self.view().iconSize().height())
+        view = self.view()
+        return QTwemojiImageProvider.getPixmap(emoji, 0, view.iconSize().height(), self._device_pixel_ratio)
 
     def fontEmojiPixmapGetter(self, font: typing.Union[str, QFont], icon: QIconItem) -> QPixmap:
         """
@@ -129,16 +477,17 @@ class QEmojiPicker(QIconPicker):
         Returns:
             Emoji pixmap getter function.
         """
-        if isinstance(font, QFont):
-            emoji_font = font
-        else:
-            emoji_font = QFont(font)
-
         emoji = self.resolveEmojiColorByIcon(icon)
-        if emoji is None:
+        if not emoji:
             return QPixmap()
 
-        return QIconGenerator.charToPixmap(emoji, self.view().iconSize(), emoji_font)
+        if isinstance(font, QFont):
+            font_description = font.toString()
+        else:
+            font_description = _font_description(font)
+
+        icon_size = self.view().iconSize()
+        return _font_emoji_pixmap(emoji, font_description, icon_size.width(), icon_size.height())
 
     def resolveEmojiColorByIcon(self, icon: QIconItem) -> str:
         """
@@ -163,17 +512,6 @@ class QEmojiPicker(QIconPicker):
         Returns:
             The colored emoji.
         """
-        emoji_char = _find_emoji_by_char(emoji)
-        if emoji_char is None:
-            return ""
-
-        if color_modifier:
-            color_emoji = emoji_char.skin_variations.get(color_modifier)
-            if color_emoji is None:
-                logging.debug(f"Color {color_modifier} not found for emoji {emoji}")
-            else:
-                return color_emoji.char
-
-        return emoji
+        return _resolve_emoji_color(emoji, color_modifier)
 
 
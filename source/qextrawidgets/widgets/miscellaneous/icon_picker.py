@@ -1,8 +1,9 @@
 import logging
-import time
 import typing
+from collections import OrderedDict
+from functools import partial
 
-from PySide6.QtCore import QSize, QTimer, Slot, QPoint, QPersistentModelIndex, QModelIndex, Signal
+from PySide6.QtCore import QSize, QTimer, Slot, QPoint, QPersistentModelIndex, QModelIndex, Signal, QEvent
 from PySide6.QtGui import Qt, QFont, QPixmap, QIcon, QFontMetrics
 from PySide6.QtWidgets import QWidget, QAbstractItemView, QButtonGroup, QLabel, QHBoxLayout, QVBoxLayout, QLineEdit, \
     QMenu, QApplication, QToolButton
@@ -27,6 +28,9 @@ class QIconPicker(QWidget):
 
     picked = Signal(QIconItem)
 
+    # Maximum number of preview pixmaps, scaled to the icon label, kept between hovers
+    PreviewPixmapCacheSize = 128
+
     def __init__(self,
                  parent=None,
                  model: typing.Optional[QIconPickerModel] = None,
@@ -49,12 +53,29 @@ class QIconPicker(QWidget):
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
         self._search_timer.setInterval(200)
+        self._last_filter = ""
 
         self._proxy = QIconPickerProxyModel()
 
         self._icon_on_label = None
         self._model = None
 
+        # Device pixel ratio the item images are loaded for, refreshed on DevicePixelRatioChange
+        self._device_pixel_ratio = self.devicePixelRatioF()
+
+        # Font metrics of the aliases label and the elided texts computed with them,
+        # valid while the label keeps the same font and width
+        self._aliases_font: typing.Optional[QFont] = None
+        self._aliases_width = -1
+        self._aliases_metrics: typing.Optional[QFontMetrics] = None
+        self._elided_aliases: typing.Dict[str, str] = {}
+        # Formatted aliases text per icon text, valid while the alias format and the aliases stay the same
+        self._aliases_texts: typing.Dict[str, str] = {}
+
+        # LRU cache of preview pixmaps keyed by (pixmap cache key, width, height, device pixel ratio),
+        # so hovering an icon again skips scaling its pixmap to the icon label
+        self._preview_pixmaps: typing.OrderedDict[typing.Tuple[int, int, int, float], QPixmap] = OrderedDict()
+
         self._init_view(icon_label_size)
         self._setup_layout()
         self._setup_connections()
@@ -104,10 +125,11 @@ class QIconPicker(QWidget):
 
         self._shortcuts_group = QButtonGroup(self)
         self._shortcuts_group.setExclusive(True)
+        # Shortcut button per category name, so removing a category does not search the widget tree
+        self._category_shortcuts: typing.Dict[str, QToolButton] = {}
 
         self._icon_label = QLabel()
         self._icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._icon_label.setScaledContents(True)
         self.setIconLabelSize(icon_label_size)
 
         self._aliases_icon_label = self._create_icon_label()
@@ -189,7 +211,8 @@ class QIconPicker(QWidget):
     def _setup_connections(self) -> None:
         """Sets up signals and slots connections."""
         self._search_timer.timeout.connect(self._on_filter_emojis)
-        self._search_line_edit.textChanged.connect(lambda: self._search_timer.start())
+        self._search_line_edit.textChanged.connect(self._search_timer.start)
+        self._search_line_edit.returnPressed.connect(self._on_search_submitted)
 
         self._grouped_icon_view.itemEntered.connect(self._on_mouse_entered_emoji)
         self._grouped_icon_view.itemExited.connect(self._on_mouse_exited_emoji)
@@ -201,7 +224,7 @@ class QIconPicker(QWidget):
         self._color_modifier_selector.currentDataChanged.connect(self._on_set_color_modifier)
 
         delegate: QGroupedIconDelegate = self._grouped_icon_view.itemDelegate()
-        delegate.requestImage.connect(self._on_request_image)
+        delegate.requestImages.connect(self._on_request_images)
 
     @Slot(QModelIndex)
     def _on_color_modifier_changed(self, index: QModelIndex) -> None:
@@ -210,7 +233,8 @@ class QIconPicker(QWidget):
         Args:
             index (QModelIndex): The index in the source model that changed.
         """
-        logging.debug("Requesting image again for {}".format(index.data(Qt.ItemDataRole.EditRole)))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Requesting image again for %s", index.data(Qt.ItemDataRole.EditRole))
         proxy_index = self._proxy.mapFromSource(index)
         delegate: QGroupedIconDelegate = self._grouped_icon_view.itemDelegate()
         delegate.forceReload(proxy_index)
@@ -237,7 +261,13 @@ class QIconPicker(QWidget):
         source_index = self._proxy.mapToSource(proxy_index)
         item = self._model.itemFromIndex(source_index)
 
+        if not isinstance(item, (QIconCategoryItem, QIconItem)):
+            return
+
+        # The menu is parented to the view, so it must be deleted explicitly or its actions
+        # (and the items they reference) would pile up on every right click
         menu = QMenu(self._grouped_icon_view)
+        menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         if isinstance(item, QIconCategoryItem):
             collapse_all_action = menu.addAction(self.tr("Collapse all"))
@@ -245,91 +275,128 @@ class QIconPicker(QWidget):
             expand_all_action = menu.addAction(self.tr("Expand all"))
             expand_all_action.triggered.connect(self._grouped_icon_view.expandAll)
 
-        elif isinstance(item, QIconItem):
+        else:
             icon_text = item.data(Qt.ItemDataRole.EditRole)
 
-            # Check if emoji exists in favorites using helper method
-            favorite_item = self._model.findIconInCategoryByName(
-                QIconPickerModel.BaseCategory.Favorites, icon_text
-            )
-
-            if favorite_item:
+            if self._model.hasIcon(QIconPickerModel.BaseCategory.Favorites, icon_text):
                 action = menu.addAction(self.tr("Unfavorite"))
                 action.triggered.connect(
-                    lambda: self._model.removeIcon(QIconPickerModel.BaseCategory.Favorites, icon_text)
+                    partial(self._model.removeIcon, QIconPickerModel.BaseCategory.Favorites, icon_text)
                 )
             else:
                 action = menu.addAction(self.tr("Favorite"))
-                # We use item.emojiChar() here because addEmoji expects an EmojiChar object
                 action.triggered.connect(
-                    lambda: self._model.addIcon(QIconPickerModel.BaseCategory.Favorites, item.clone())
+                    partial(self._model.addIcon, QIconPickerModel.BaseCategory.Favorites, item.clone())
                 )
 
             copy_alias_action = menu.addAction(self.tr("Copy alias"))
-            clipboard = QApplication.clipboard()
             aliases = item.data(Qt.ItemDataRole.UserRole)
 
             alias = aliases[0] if aliases else item.data(Qt.ItemDataRole.EditRole)
-            copy_alias_action.triggered.connect(lambda: clipboard.setText(alias))
-        else:
-            return
+            copy_alias_action.triggered.connect(partial(QApplication.clipboard().setText, alias))
 
         menu.exec(self._grouped_icon_view.mapToGlobal(position))
 
-    @Slot(QPersistentModelIndex)
-    def _on_request_image(self, persistent_index: QPersistentModelIndex) -> None:
-        """Loads the emoji image when requested by the delegate.
+    def _item_from_proxy_index(self, proxy_index: typing.Union[QModelIndex, QPersistentModelIndex]) -> typing.Optional[QIconItem]:
+        """Returns the icon item of a view index.
+
+        Persistent indexes are mapped directly, without converting them to QModelIndex first.
 
         Args:
-            persistent_index (QPersistentModelIndex): The persistent index of the item needing an image.
+            proxy_index (Union[QModelIndex, QPersistentModelIndex]): The index in the proxy model.
+
+        Returns:
+            Optional[QIconItem]: The icon item, or None if the index is not an icon.
         """
-        start = time.perf_counter()
+        source_index = self._proxy.mapToSource(proxy_index)
+        if not source_index.isValid():
+            return None
 
-        if not persistent_index.isValid():
-            return
+        item = self._model.itemFromIndex(source_index)
+        if isinstance(item, QIconItem):
+            return item
+        return None
 
-        icon_pixmap_getter = self.iconPixmapGetter()
+    @Slot(list)
+    def _on_request_images(self, persistent_indexes: typing.List[QPersistentModelIndex]) -> None:
+        """Loads the emoji images requested by the delegate during the last paint events.
+
+        The icons are set together, so the model announces them with a few dataChanged ranges.
 
+        Args:
+            persistent_indexes (List[QPersistentModelIndex]): The persistent indexes of the items needing an image.
+        """
+        icon_pixmap_getter = self.iconPixmapGetter()
         if not icon_pixmap_getter:
             return
 
-        # 1. Explicitly convert to QModelIndex
-        # Note: QModelIndex constructor does not accept QPersistentModelIndex directly in PySide6
-        proxy_index = persistent_index.model().index(
-            persistent_index.row(), persistent_index.column(), persistent_index.parent()
-        )
+        item_icons = []
+        for persistent_index in persistent_indexes:
+            if not persistent_index.isValid():
+                continue
 
-        if not proxy_index.isValid():
-            return
+            item = self._item_from_proxy_index(persistent_index)
+            if item is None:
+                continue
 
-        # 2. Map from Proxy to Source Model
-        source_index = self._proxy.mapToSource(proxy_index)
+            pixmap = icon_pixmap_getter(item)
+            if pixmap.isNull():
+                logging.warning("Null pixmap generated for %s", item.data(Qt.ItemDataRole.EditRole))
+            item_icons.append((item, pixmap))
 
-        if not source_index.isValid():
+        self._model.setIcons(item_icons)
+
+    def _paint_emoji_on_label(self) -> None:
+        """Updates the preview label with the current emoji pixmap.
+
+        The pixmap is scaled once to the label size in device pixels, so the label paints it without scaling.
+        """
+        if not self._icon_on_label:
             return
 
-        # 3. Fetch the item and set the image
-        item = self._model.itemFromIndex(source_index)
-        if isinstance(item, QIconItem):
-            # Generate the pixmap
-            pixmap = icon_pixmap_getter(item)
+        icon_pixmap_getter = self.iconPixmapGetter()
+        if not icon_pixmap_getter:
+            return
 
-            # Debug: Ensure the pixmap was generated
-            if pixmap.isNull():
-                logging.warning(f"Null pixmap generated for {item.data(Qt.ItemDataRole.EditRole)}")
+        pixmap = icon_pixmap_getter(self._icon_on_label)
+        if not pixmap.isNull():
+            pixmap = self._preview_pixmap(pixmap)
 
-            # Set the icon (This triggers dataChanged in model -> proxy -> view)
-            item.setIcon(pixmap)
+        self._icon_label.setPixmap(pixmap)
 
-        end = time.perf_counter()
-        logging.debug(f"Requested image for {item.data(Qt.ItemDataRole.EditRole)} in {end - start:.6f} seconds")
+    def _preview_pixmap(self, pixmap: QPixmap) -> QPixmap:
+        """Returns the pixmap scaled to the icon label size in device pixels, reusing previous hovers.
 
-    def _paint_emoji_on_label(self) -> None:
-        """Updates the preview label with the current emoji pixmap."""
-        icon_pixmap_getter = self.iconPixmapGetter()
-        if self._icon_on_label and icon_pixmap_getter:
-            pixmap = icon_pixmap_getter(self._icon_on_label)
-            self._icon_label.setPixmap(pixmap)
+        Args:
+            pixmap (QPixmap): The icon pixmap.
+
+        Returns:
+            QPixmap: The preview pixmap.
+        """
+        dpr = self._icon_label.devicePixelRatioF()
+        target_size = self._icon_label.size() * dpr
+        key = (pixmap.cacheKey(), target_size.width(), target_size.height(), dpr)
+
+        preview_pixmap = self._preview_pixmaps.get(key)
+        if preview_pixmap is not None:
+            self._preview_pixmaps.move_to_end(key)
+            return preview_pixmap
+
+        if pixmap.size() != target_size:
+            preview_pixmap = pixmap.scaled(
+                target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        else:
+            preview_pixmap = QPixmap(pixmap)
+        preview_pixmap.setDevicePixelRatio(dpr)
+
+        self._preview_pixmaps[key] = preview_pixmap
+        while len(self._preview_pixmaps) > self.PreviewPixmapCacheSize:
+            self._preview_pixmaps.popitem(last=False)
+
+        return preview_pixmap
 
     def _paint_skintones(self) -> None:
         """Updates the skin tone selector icons."""
@@ -339,16 +406,16 @@ class QIconPicker(QWidget):
             if icon:
                 self._color_modifier_selector.setItemIcon(index, icon)
 
-    @Slot(QModelIndex)
-    def _on_shortcut_clicked(self, source_index: QModelIndex) -> None:
+    def _on_shortcut_clicked(self, category_item: QIconCategoryItem) -> None:
         """Scrolls the view to the selected category section.
 
         Args:
-            source_index (QModelIndex): The index of the category in the source model.
+            category_item (QIconCategoryItem): The category of the clicked shortcut.
         """
-        proxy_index = self._proxy.mapFromSource(source_index)
-        self._grouped_icon_view.scrollTo(proxy_index)
+        proxy_index = self._proxy.mapFromSource(category_item.index())
+        # Expand first, so the scroll range already includes the category items
         self._grouped_icon_view.setExpanded(QPersistentModelIndex(proxy_index), True)
+        self._grouped_icon_view.scrollTo(proxy_index)
 
     @Slot(QIconCategoryItem)
     def _on_categories_inserted(self, category_item: QIconCategoryItem) -> None:
@@ -362,12 +429,11 @@ class QIconPicker(QWidget):
 
         shortcut = self._create_shortcut_button(category, icon)
         shortcut.setObjectName(category)
-        shortcut.clicked.connect(
-            lambda: self._on_shortcut_clicked(category_item.index())
-        )
+        shortcut.clicked.connect(partial(self._on_shortcut_clicked, category_item))
 
         self._shortcuts_layout.addWidget(shortcut)
         self._shortcuts_group.addButton(shortcut)
+        self._category_shortcuts[category_item.category()] = shortcut
 
     @Slot(QIconCategoryItem)
     def _on_categories_removed(self, category_item: QIconCategoryItem) -> None:
@@ -376,8 +442,7 @@ class QIconPicker(QWidget):
         Args:
             category_item (QIconCategoryItem): The removed category item.
         """
-        category = category_item.category()
-        button = self._shortcuts_container.findChild(QToolButton, category)
+        button = self._category_shortcuts.pop(category_item.category(), None)
 
         if button:
             self._shortcuts_layout.removeWidget(button)
@@ -387,16 +452,22 @@ class QIconPicker(QWidget):
     @Slot()
     def _on_model_reset(self):
         """Handles the reset of the model."""
-        for button in self._shortcuts_group.buttons():
-            self._shortcuts_layout.removeWidget(button)
-            self._shortcuts_group.removeButton(button)
-            button.deleteLater()
-
-        model = self.model()
-        for row in range(model.rowCount()):
-            item = model.item(row)
-            if isinstance(item, QIconCategoryItem):
-                self._on_categories_inserted(item)
+        self._aliases_texts.clear()
+
+        # Rebuild every shortcut with a single layout pass and repaint
+        self._shortcuts_container.setUpdatesEnabled(False)
+        try:
+            for button in self._shortcuts_group.buttons():
+                self._shortcuts_layout.removeWidget(button)
+                self._shortcuts_group.removeButton(button)
+                button.deleteLater()
+            self._category_shortcuts.clear()
+
+            for category_item in self.model().categories():
+                self._on_categories_inserted(category_item)
+        finally:
+            self._shortcuts_layout.activate()
+            self._shortcuts_container.setUpdatesEnabled(True)
 
     @Slot(QModelIndex)
     def _on_mouse_entered_emoji(self, index: QModelIndex) -> None:
@@ -405,29 +476,65 @@ class QIconPicker(QWidget):
         Args:
             index (QModelIndex): The index of the item under the mouse.
         """
-        source_index = self._proxy.mapToSource(index)
-        item = self._model.itemFromIndex(source_index)
-        if isinstance(item, QIconItem):
+        item = self._item_from_proxy_index(index)
+        if item is not None:
             self._icon_on_label = item
             self._paint_emoji_on_label()
 
-            aliases = item.data(Qt.ItemDataRole.UserRole) or [item.data(Qt.ItemDataRole.EditRole)]
-            aliases_text = " ".join(self._alias_format.format(alias=alias) for alias in aliases)
+            icon_text = item.data(Qt.ItemDataRole.EditRole)
+            aliases_text = self._aliases_texts.get(icon_text)
+            if aliases_text is None:
+                aliases = item.data(Qt.ItemDataRole.UserRole) or [icon_text]
+                aliases_text = " ".join(self._alias_format.format(alias=alias) for alias in aliases)
+                self._aliases_texts[icon_text] = aliases_text
 
-            metrics = QFontMetrics(self._aliases_icon_label.font())
-            elided_alias = metrics.elidedText(
-                aliases_text,
-                Qt.TextElideMode.ElideRight,
-                self._aliases_icon_label.width(),
-            )
-            self._aliases_icon_label.setText(elided_alias)
+            self._aliases_icon_label.setText(self._elided_aliases_text(aliases_text))
+
+    @Slot(QModelIndex, QModelIndex, list)
+    def _on_model_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: typing.Optional[typing.List[int]] = None) -> None:
+        """Drops the formatted aliases texts when the aliases of an icon may have changed.
+
+        Args:
+            top_left (QModelIndex): Top left changed index.
+            bottom_right (QModelIndex): Bottom right changed index.
+            roles (List[int], optional): Changed roles.
+        """
+        if not roles or Qt.ItemDataRole.UserRole in roles:
+            self._aliases_texts.clear()
+
+    def _elided_aliases_text(self, aliases_text: str) -> str:
+        """Elides the aliases text to the width of the aliases label.
+
+        The font metrics and the elided texts are reused until the label font or width changes.
+
+        Args:
+            aliases_text (str): The full aliases text.
+
+        Returns:
+            str: The elided text.
+        """
+        font = self._aliases_icon_label.font()
+        width = self._aliases_icon_label.width()
+
+        if self._aliases_metrics is None or width != self._aliases_width or font != self._aliases_font:
+            self._aliases_font = font
+            self._aliases_width = width
+            self._aliases_metrics = QFontMetrics(font)
+            self._elided_aliases.clear()
+
+        elided_text = self._elided_aliases.get(aliases_text)
+        if elided_text is None:
+            elided_text = self._aliases_metrics.elidedText(aliases_text, Qt.TextElideMode.ElideRight, width)
+            self._elided_aliases[aliases_text] = elided_text
+
+        return elided_text
 
     @Slot()
     def _on_mouse_exited_emoji(self) -> None:
         """Clears the emoji preview area."""
         self._icon_label.clear()
         self._aliases_icon_label.clear()
-        self._emoji_on_label = None
+        self._icon_on_label = None
 
     @Slot(QModelIndex)
     def _on_item_clicked(self, proxy_index: QModelIndex) -> None:
@@ -436,25 +543,56 @@ class QIconPicker(QWidget):
         Args:
             proxy_index (QModelIndex): The index in the proxy model that was clicked.
         """
-        source_index = self._proxy.mapToSource(proxy_index)
-        item = self._model.itemFromIndex(source_index)
+        item = self._item_from_proxy_index(proxy_index)
 
-        if not isinstance(item, QIconItem):
+        if item is None:
             return
 
         self.picked.emit(item)
 
-        recent_category_item = self._model.findCategory(QIconPickerModel.BaseCategory.Recents)
+        recents = QIconPickerModel.BaseCategory.Recents
 
-        if recent_category_item:
-            self._model.addIcon(QIconPickerModel.BaseCategory.Recents, item.clone())
+        # Repeated picks of a recent icon only need the O(1) lookup, not a clone of the item
+        if self._model.findCategory(recents) and not self._model.hasIcon(recents, item.data(Qt.ItemDataRole.EditRole)):
+            self._model.addIcon(recents, item.clone())
 
     @Slot()
     def _on_filter_emojis(self) -> None:
         """Filters the emojis across all categories based on the search text."""
         text = self._search_line_edit.text()
+
+        # Typing and erasing within the debounce interval leaves the filter as it was
+        if text == self._last_filter:
+            return
+
+        self._last_filter = text
         self._proxy.setFilterFixedString(text)
 
+    @Slot()
+    def _on_search_submitted(self) -> None:
+        """Applies the search text right away when Enter is pressed."""
+        self._search_timer.stop()
+        self._on_filter_emojis()
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Reloads the images when the widget moves to a screen with another device pixel ratio.
+
+        Args:
+            event (QEvent): The change event.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            device_pixel_ratio = self.devicePixelRatioF()
+            if device_pixel_ratio != self._device_pixel_ratio:
+                self._device_pixel_ratio = device_pixel_ratio
+                # Release the images loaded for the old ratio; only the visible ones are loaded again
+                if self._model is not None:
+                    self._model.clearIcons()
+                self._preview_pixmaps.clear()
+                self.delegate().forceReloadAll()
+                self._grouped_icon_view.viewport().update()
+            self._paint_emoji_on_label()
+
     # Public methods
     def addColorOption(self, data: QIconItem):
         """
@@ -483,10 +621,15 @@ class QIconPicker(QWidget):
         """
 
         self._icon_pixmap_getter = icon_pixmap_getter
+        self._preview_pixmaps.clear()
 
         self._paint_emoji_on_label()
         self._paint_skintones()
 
+        # Release the images of the previous getter; only the visible ones are loaded again
+        if self._model is not None:
+            self._model.clearIcons()
+
         delegate = self.delegate()
         delegate.forceReloadAll()
 
@@ -510,6 +653,8 @@ class QIconPicker(QWidget):
                 self._model.categoryInserted.disconnect(self._on_categories_inserted)
                 self._model.categoryRemoved.disconnect(self._on_categories_removed)
                 self._model.colorChanged.disconnect(self._on_color_modifier_changed)
+                self._model.modelReset.disconnect(self._on_model_reset)
+                self._model.dataChanged.disconnect(self._on_model_data_changed)
 
             self._model = model
             self._proxy.setSourceModel(self._model)
@@ -517,6 +662,8 @@ class QIconPicker(QWidget):
             self._model.categoryInserted.connect(self._on_categories_inserted)
             self._model.categoryRemoved.connect(self._on_categories_removed)
             self._model.colorChanged.connect(self._on_color_modifier_changed)
+            self._model.modelReset.connect(self._on_model_reset)
+            self._model.dataChanged.connect(self._on_model_data_changed)
 
             self._on_model_reset()
 
@@ -532,6 +679,7 @@ class QIconPicker(QWidget):
             size(int): The size of the icon label
         """
         self._icon_label.setFixedSize(QSize(size, size))
+        self._paint_emoji_on_label()
 
     def setAliasFormat(self, alias_format: str):
         """
@@ -541,6 +689,7 @@ class QIconPicker(QWidget):
             alias_format: Alias format.
         """
         self._alias_format = alias_format
+        self._aliases_texts.clear()
 
     def translateUI(self) -> None:
         """Translates the UI components."""
@@ -14,7 +14,7 @@ from PySide6.QtCore import (
     QItemSelectionModel,
     Slot,
 )
-from PySide6.QtGui import QCursor, QPainter, QMouseEvent, QRegion, QPaintEvent
+from PySide6.QtGui import QCursor, QPainter, QMouseEvent, QRegion, QPaintEvent, QShowEvent
 from PySide6.QtWidgets import QAbstractItemView, QStyleOptionViewItem, QStyle, QWidget
 
 from qextrawidgets.widgets.delegates.grid_icon_delegate import QGridIconDelegate
@@ -59,6 +59,8 @@ class QGridIconView(QAbstractItemView):
         self._layout_timer.setSingleShot(True)
         self._layout_timer.setInterval(0)
         self._layout_timer.timeout.connect(self._execute_delayed_layout)
+        # Set when a layout is requested while the view is hidden; it runs on the next show instead
+        self._layout_deferred: bool = False
 
         # View State
         self._hover_index: QPersistentModelIndex = QPersistentModelIndex()
@@ -190,22 +192,31 @@ class QGridIconView(QAbstractItemView):
             if not self.verticalScrollBar().isSliderDown():
                 self.viewport().update()
 
-    def _init_option(self, option: QStyleOptionViewItem, index: QPersistentModelIndex, visual_rect: QRect) -> None:
+    def _init_option(
+        self,
+        option: QStyleOptionViewItem,
+        index: QPersistentModelIndex,
+        visual_rect: QRect,
+        base_state: typing.Optional[QStyle.StateFlag] = None,
+    ) -> None:
         """
         Initialize the style option for the given index.
 
         Args:
             option (QStyleOptionViewItem): The option to initialize.
             index (QModelIndex): The index of the item.
+            visual_rect (QRect): The item rect in viewport coordinates.
+            base_state (QStyle.StateFlag, optional): The state shared by every item, computed once per paint.
+                Computed from the view when None.
         """
         # Optimization: We check intersections in paintEvent loop usually,
         # but here we just set the rect. The caller (paintEvent) already checks visibility.
         setattr(option, "rect", visual_rect)
 
-        state = QStyle.StateFlag.State_None
+        if base_state is None:
+            base_state = self._base_item_state()
 
-        if self.isEnabled():
-            state |= QStyle.StateFlag.State_Enabled
+        state = base_state
 
         if self.selectionModel().isSelected(index):
             state |= QStyle.StateFlag.State_Selected
@@ -215,6 +226,17 @@ class QGridIconView(QAbstractItemView):
 
         setattr(option, "state", state)
 
+    def _base_item_state(self) -> QStyle.StateFlag:
+        """
+        Return the style state shared by every item of the view.
+
+        Returns:
+            QStyle.StateFlag: The shared state.
+        """
+        if self.isEnabled():
+            return QStyle.StateFlag.State_Enabled
+        return QStyle.StateFlag.State_None
+
     def _get_coordinates_at(self, point: QPoint) -> typing.Tuple[int, int]:
         """
         Translates a point into row and column coordinates.
@@ -225,7 +247,7 @@ class QGridIconView(QAbstractItemView):
         Returns:
             A Tuple of row and column.
         """
-        logging.debug(f"Looking for index at {point}")
+        logging.debug("Looking for index at %s", point)
         item_w = self.iconSize().width()
         item_h = self.iconSize().height()
 
@@ -318,7 +340,16 @@ class QGridIconView(QAbstractItemView):
     # -------------------------------------------------------------------------
 
     def _schedule_layout(self) -> None:
-        """Schedule to update the layout."""
+        """
+        Schedule to update the layout.
+
+        While the view is hidden the layout is deferred to showEvent,
+        so views created ahead of time or kept hidden do not lay out items nobody sees.
+        """
+        if not self.isVisible():
+            self._layout_deferred = True
+            return
+
         if not self._layout_timer.isActive():
             self._layout_timer.start()
 
@@ -327,6 +358,13 @@ class QGridIconView(QAbstractItemView):
         self.updateGeometries()
         self.viewport().update()
 
+    def _execute_pending_layout(self) -> None:
+        """Run a scheduled or deferred layout right away, so the cached geometries are current."""
+        if self._layout_timer.isActive() or self._layout_deferred:
+            self._layout_timer.stop()
+            self._layout_deferred = False
+            self._execute_delayed_layout()
+
     def _clear_cache(self, *args) -> None:
         """Clear all the cached variables."""
         self._item_rects.clear()
@@ -431,6 +469,18 @@ class QGridIconView(QAbstractItemView):
     # Event Handlers
     # -------------------------------------------------------------------------
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Handle show events to run the layout deferred while the view was hidden.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        if self._layout_deferred:
+            self._layout_deferred = False
+            self._execute_delayed_layout()
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
         Handle mouse press events.
@@ -495,16 +545,20 @@ class QGridIconView(QAbstractItemView):
         scroll_y = vertical_scroll_bar.value()
 
         item_delegate = self.itemDelegate()
+        base_state = self._base_item_state()
+        # Checked once per paint, so the per-item message arguments are never built when debug is off
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for p_index, rect in self._visible_items():
             visual_rect = rect.translated(0, -scroll_y)
 
-            logger.debug(f"Paiting {p_index.data(Qt.EditRole)} at {rect.x()}, {rect.y()}.")
-            self._init_option(option, p_index, visual_rect)
+            if is_debug_enabled:
+                logger.debug("Painting %s at %s, %s.", p_index.data(Qt.ItemDataRole.EditRole), rect.x(), rect.y())
+            self._init_option(option, p_index, visual_rect, base_state)
             item_delegate.paint(painter, option, p_index)
 
         end = time.perf_counter()
-        logger.debug(f"Finished paintEvent in {end - start:.6f} seconds.")
+        logger.debug("Finished paintEvent in %.6f seconds.", end - start)
 
     # -------------------------------------------------------------------------
     # QAbstractItemView Implementation
@@ -530,6 +584,8 @@ class QGridIconView(QAbstractItemView):
         logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}.updateGeometries")
 
         start = time.perf_counter()
+        # Any layout, including the ones Qt runs on resize, satisfies a layout deferred while hidden
+        self._layout_deferred = False
 
         if not self.model():
             return
@@ -558,7 +614,7 @@ class QGridIconView(QAbstractItemView):
 
         super().updateGeometries()
         end = time.perf_counter()
-        logger.debug(f"Finished updateGeometries in {end - start:.6f} seconds.")
+        logger.debug("Finished updateGeometries in %.6f seconds.", end - start)
 
     def visualRect(
         self, index: typing.Union[QModelIndex, QPersistentModelIndex]
@@ -592,7 +648,7 @@ class QGridIconView(QAbstractItemView):
 
         point.setY(point.y() + self.verticalScrollBar().value())
         row, col = self._get_coordinates_at(point)
-        logger.debug(f"Looking for index at {row}, {col}")
+        logger.debug("Looking for index at %s, %s", row, col)
 
         cols_p_index = self._item_indexes.get(row)
         if not cols_p_index:
@@ -601,7 +657,7 @@ class QGridIconView(QAbstractItemView):
         result = cols_p_index.get(col)
         if result:
             p_index, _ = result
-            logger.debug(f"Found index {p_index}")
+            logger.debug("Found index %s", p_index)
             return QModelIndex(p_index)
 
         return QModelIndex()
@@ -619,6 +675,9 @@ class QGridIconView(QAbstractItemView):
             index (QModelIndex | QPersistentModelIndex): The index to scroll to.
             hint (QAbstractItemView.ScrollHint): The scroll hint.
         """
+        # Like the Qt views, lay out pending changes first, so the scroll targets the new geometry
+        self._execute_pending_layout()
+
         p_index = QPersistentModelIndex(index)
         rect = self._item_rects.get(p_index)
         if not rect:
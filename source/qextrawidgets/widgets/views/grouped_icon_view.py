@@ -1,3 +1,4 @@
+import bisect
 import logging
 import time
 import typing
@@ -47,6 +48,11 @@ class QGroupedIconView(QGridIconView):
         # View State
         self._expanded_items: set[QPersistentModelIndex] = set()
         self._item_indexes: dict[QPersistentModelIndex, dict[int, dict[int, typing.Tuple[QPersistentModelIndex, QRect]]]] = {}
+        # Per category in display order: header index, header rect, grid of item rows and number of grid rows
+        # (0 when collapsed). Built with the layout, so painting iterates a tuple instead of looking each part up.
+        self._category_layouts: typing.Tuple[typing.Tuple[QPersistentModelIndex, QRect, dict[int, dict[int, typing.Tuple[QPersistentModelIndex, QRect]]], int], ...] = ()
+        # Top of each category header in the same order, so indexAt bisects instead of testing every category
+        self._category_tops: typing.List[int] = []
 
         # Layout Configuration
         self._header_height: int = header_height
@@ -125,11 +131,17 @@ class QGroupedIconView(QGridIconView):
         """Check if the given index represents a category (header)."""
         return not index.parent().isValid()
 
-    def _init_option(self, option: QStyleOptionViewItem, index: QPersistentModelIndex, visual_rect: QRect) -> None:
+    def _init_option(
+        self,
+        option: QStyleOptionViewItem,
+        index: QPersistentModelIndex,
+        visual_rect: QRect,
+        base_state: typing.Optional[QStyle.StateFlag] = None,
+    ) -> None:
         """
         Initialize the style option with expansion state.
         """
-        super()._init_option(option, index, visual_rect)
+        super()._init_option(option, index, visual_rect, base_state)
 
         if self.isExpanded(index):
             state = typing.cast(QStyle.StateFlag, option.state)
@@ -139,8 +151,8 @@ class QGroupedIconView(QGridIconView):
     def _clear_cache(self, *args) -> None:
         """Clear geometries cache."""
         super()._clear_cache(*args)
-        # Clean up invalid persistent indices from expansion set
-        self._expanded_items = {pi for pi in self._expanded_items if pi.isValid()}
+        self._category_layouts = ()
+        self._category_tops = []
 
     def setModel(self, model: typing.Optional[QAbstractItemModel]) -> None:
         """
@@ -171,18 +183,13 @@ class QGroupedIconView(QGridIconView):
 
         viewport_rect = self.viewport().rect()
         viewport_rect.translate(0, self.verticalScrollBar().value())
-        logger.debug(f"Viewport rect: {viewport_rect}")
-
-        for category_index, grid in self._item_indexes.items():
-            category_rect = self._item_rects[category_index]
-            # logger.debug(f"Category {category_index.data(Qt.ItemDataRole.EditRole)} rect: {category_rect}")
+        logger.debug("Viewport rect: %s", viewport_rect)
 
+        for category_index, category_rect, grid, rows_count in self._category_layouts:
             if viewport_rect.intersects(category_rect):
                 yield category_index, category_rect
 
-            if self.isExpanded(category_index) and grid:
-                rows_count = max(grid.keys()) + 1
-
+            if rows_count:
                 category_viewport_rect = QRect(viewport_rect)
                 category_viewport_rect.translate(0, -category_rect.bottomLeft().y())
 
@@ -192,7 +199,7 @@ class QGroupedIconView(QGridIconView):
 
                 if first_row > rows_count:
                     continue
-                logger.debug(f"Looking for visible items between rows {first_row} and {last_row}")
+                logger.debug("Looking for visible items between rows %s and %s", first_row, last_row)
 
                 for i in range(first_row, last_row + 1):
                     columns_values = grid.get(i)
@@ -236,12 +243,19 @@ class QGroupedIconView(QGridIconView):
         logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}.updateGeometries")
 
         start = time.perf_counter()
+        # Any layout, including the ones Qt runs on resize, satisfies a layout deferred while hidden
+        self._layout_deferred = False
         model = self.model()
 
         if not model:
             return
 
+        # Clean up the persistent indices of removed categories from the expansion set.
+        # Done once per layout rather than on every removal, since filtering removes many row ranges at once.
+        self._expanded_items = {pi for pi in self._expanded_items if pi.isValid()}
+
         self._item_rects.clear()
+        category_layouts = []
         width = self.viewport().width()
         y = 0
 
@@ -256,24 +270,30 @@ class QGroupedIconView(QGridIconView):
 
             cat_persistent_index = QPersistentModelIndex(cat_index)
 
-            self._item_rects[cat_persistent_index] = QRect(
-                0, y, width, self._header_height
-            )
+            category_rect = QRect(0, y, width, self._header_height)
+            self._item_rects[cat_persistent_index] = category_rect
 
-            self._item_indexes[cat_persistent_index] = {}
+            grid = self._item_indexes[cat_persistent_index] = {}
+            rows_count = 0
 
             y += self._header_height
 
-            rows = list(self._rows(cat_index))
+            # Collapsed categories show no items, so their rows are not read at all
+            rows = list(self._rows(cat_index)) if self.isExpanded(cat_persistent_index) else None
 
-            if self.isExpanded(cat_persistent_index) and rows:
+            if rows:
                 for row, persistent_index in enumerate(rows):
-                    self._populate_grid_caches(row, persistent_index, self._item_indexes[cat_persistent_index], y)
+                    self._populate_grid_caches(row, persistent_index, grid, y)
 
-                rows_count = max(self._item_indexes[cat_persistent_index].keys()) + 1
-                logger.debug(f"Rows count: {rows_count}")
+                rows_count = max(grid.keys()) + 1
+                logger.debug("Rows count: %s", rows_count)
                 y += self._calculate_rows_height(rows_count)
-                logger.debug(f"Rows height: {self._header_height}")
+                logger.debug("Rows height: %s", self._header_height)
+
+            category_layouts.append((cat_persistent_index, category_rect, grid, rows_count))
+
+        self._category_layouts = tuple(category_layouts)
+        self._category_tops = [category_rect.y() for _, category_rect, _, _ in category_layouts]
 
         content_height = y
         scroll_range = max(0, content_height - self.viewport().height())
@@ -285,7 +305,7 @@ class QGroupedIconView(QGridIconView):
         vertical_scroll_bar.setSingleStep(self._header_height)
 
         end = time.perf_counter()
-        logger.debug(f"Finished updateGeometries in {end - start:.6f} seconds.")
+        logger.debug("Finished updateGeometries in %.6f seconds.", end - start)
 
         # We don't call super().updateGeometries() because we fully implemented it here for the grouped view
 
@@ -301,6 +321,8 @@ class QGroupedIconView(QGridIconView):
             index (QModelIndex | QPersistentModelIndex): The index to scroll to.
             hint (QAbstractItemView.ScrollHint): The scroll hint.
         """
+        self._execute_pending_layout()
+
         p_index = QPersistentModelIndex(index)
         rect = self._item_rects.get(p_index)
         if not rect:
@@ -343,28 +365,31 @@ class QGroupedIconView(QGridIconView):
         """
         logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}.indexAt")
 
-        for category_index, grid in self._item_indexes.items():
-            real_point = point + QPoint(0, self.verticalScrollBar().value())
-            logger.debug(f"Looking for index at {real_point}")
+        real_point = point + QPoint(0, self.verticalScrollBar().value())
+        logger.debug("Looking for index at %s", real_point)
 
-            category_rect = self._item_rects[category_index]
-            logger.debug(f"Verifying if point is on category {category_rect}")
-            if category_rect.contains(real_point):
-                logger.debug(f"Yes, point is on category {category_rect}")
-                return QModelIndex(category_index)
+        # Categories are laid out top to bottom, so the point can only be in the last one starting above it
+        position = bisect.bisect_right(self._category_tops, real_point.y()) - 1
+        if position < 0:
+            return QModelIndex()
 
-            if self.isExpanded(category_index):
-                row, col = self._get_coordinates_at(real_point - category_rect.bottomLeft())
-                logger.debug(f"Looking for index at {row}, {col}")
+        category_index, category_rect, grid, rows_count = self._category_layouts[position]
 
-                cols_p_index = grid.get(row)
-                if not cols_p_index:
-                    continue
+        logger.debug("Verifying if point is on category %s", category_rect)
+        if category_rect.contains(real_point):
+            logger.debug("Yes, point is on category %s", category_rect)
+            return QModelIndex(category_index)
+
+        if rows_count:
+            row, col = self._get_coordinates_at(real_point - category_rect.bottomLeft())
+            logger.debug("Looking for index at %s, %s", row, col)
 
+            cols_p_index = grid.get(row)
+            if cols_p_index:
                 result = cols_p_index.get(col)
                 if result:
                     p_index, rect = result
-                    logger.debug(f"Found index {p_index}")
+                    logger.debug("Found index %s", p_index)
                     if rect.contains(real_point):
                         return QModelIndex(p_index)
 
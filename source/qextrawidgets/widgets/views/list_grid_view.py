@@ -1,5 +1,5 @@
 import typing
-from PySide6.QtCore import QSize, Qt, Signal, QEvent
+from PySide6.QtCore import QSize, Qt, Signal, QEvent, QAbstractItemModel, Slot
 from PySide6.QtGui import QResizeEvent
 from PySide6.QtWidgets import QListView, QAbstractScrollArea, QSizePolicy, QWidget
 
@@ -21,6 +21,10 @@ class QListGridView(QListView):
         """
         super().__init__(parent)
 
+        # Size hint of the last layout pass and the (width, grid width, grid height, rows) it was computed for
+        self._cached_size_hint: typing.Optional[QSize] = None
+        self._cached_size_hint_key: typing.Tuple[int, int, int, int] = (-1, -1, -1, -1)
+
         self.setMouseTracking(True)  # Essential for hover to work
 
         # Default settings
@@ -28,6 +32,9 @@ class QListGridView(QListView):
         self.setResizeMode(QListView.ResizeMode.Adjust)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.setUniformItemSizes(True)
+        # Lay out large models in batches between events instead of all items at once
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(256)
         self.setWrapping(True)
         self.setDragEnabled(False)
         self.setSpacing(0)
@@ -43,35 +50,96 @@ class QListGridView(QListView):
         # Native adjustment (helps, but sizeHint does the heavy lifting)
         self.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
 
+    def setModel(self, model: typing.Optional[QAbstractItemModel]) -> None:
+        """Sets the model and invalidates the size hint whenever its rows change.
+
+        Args:
+            model (QAbstractItemModel, optional): The model.
+        """
+        current_model = self.model()
+        if current_model is not None:
+            current_model.rowsInserted.disconnect(self._invalidate_size_hint)
+            current_model.rowsRemoved.disconnect(self._invalidate_size_hint)
+            current_model.modelReset.disconnect(self._invalidate_size_hint)
+            current_model.layoutChanged.disconnect(self._invalidate_size_hint)
+
+        super().setModel(model)
+
+        if model is not None:
+            model.rowsInserted.connect(self._invalidate_size_hint)
+            model.rowsRemoved.connect(self._invalidate_size_hint)
+            model.modelReset.connect(self._invalidate_size_hint)
+            model.layoutChanged.connect(self._invalidate_size_hint)
+
+        self._invalidate_size_hint()
+
+    def setGridSize(self, size: QSize) -> None:
+        """Sets the grid size and invalidates the size hint.
+
+        Args:
+            size (QSize): The grid size.
+        """
+        super().setGridSize(size)
+        self._invalidate_size_hint()
+
+    @Slot()
+    def _invalidate_size_hint(self) -> None:
+        """Drops the cached size hint, so the next layout pass computes it again."""
+        self._cached_size_hint = None
+        self.updateGeometry()
+
     def sizeHint(self) -> QSize:
         """Informs the layout of the ideal size for this widget.
 
         Calculates the height needed to display all items based on the current width.
+        The result is cached until the width, the grid size or the model rows change.
 
         Returns:
             QSize: The calculated size hint.
         """
-        if self.model() is None or self.model().rowCount() == 0:
-            return QSize(0, 0)
-
         # Available width (if widget hasn't been shown yet, use a default value)
         width = self.width() if self.width() > 0 else 400
 
+        model = self.model()
+        total_items = model.rowCount() if model is not None else 0
+        grid_size = self.gridSize()
+
+        key = (width, grid_size.width(), grid_size.height(), total_items)
+        if self._cached_size_hint is not None and self._cached_size_hint_key == key:
+            return self._cached_size_hint
+
+        self._cached_size_hint = self._compute_size_hint(width, grid_size, total_items)
+        self._cached_size_hint_key = key
+        return self._cached_size_hint
+
+    @staticmethod
+    def _compute_size_hint(width: int, grid_size: QSize, total_items: int) -> QSize:
+        """Calculates the size needed to display the items in the given width.
+
+        Args:
+            width (int): The available width.
+            grid_size (QSize): The size of each grid cell.
+            total_items (int): The number of items.
+
+        Returns:
+            QSize: The calculated size hint.
+        """
+        if total_items == 0:
+            return QSize(0, 0)
+
         # Grid dimensions
-        grid_sz = self.gridSize()
-        if grid_sz.isEmpty():
-            grid_sz = QSize(40, 40)  # Fallback
+        if grid_size.isEmpty():
+            grid_size = QSize(40, 40)  # Fallback
 
         # Mathematical calculation
-        item_width = grid_sz.width()
-        item_height = grid_sz.height()
+        item_width = grid_size.width()
+        item_height = grid_size.height()
 
         # How many fit per row?
         items_per_row = max(1, width // item_width)
 
         # How many rows do we need?
-        total_items = self.model().rowCount()
-        rows = (total_items + items_per_row - 1) // items_per_row  # Ceil division
+        rows = -(-total_items // items_per_row)  # Ceil division
 
         height = rows * item_height + 5  # +5 safety padding
 
@@ -89,10 +157,12 @@ class QListGridView(QListView):
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handles the resize event.
 
-        Triggers a geometry update to recalculate the size hint.
+        Triggers a geometry update to recalculate the size hint when the width changes,
+        since the height only depends on how many items fit per row.
 
         Args:
             event (QResizeEvent): The resize event.
         """
         super().resizeEvent(event)
-        self.updateGeometry()
+        if event.size().width() != event.oldSize().width():
+            self.updateGeometry()
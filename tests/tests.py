@@ -1,8 +1,16 @@
 import pytest
-from PySide6.QtGui import QValidator
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QIcon, QPixmap, QStandardItem, QStandardItemModel, QValidator
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 from qextrawidgets.core.utils.emoji_finder import QEmojiFinder
+from qextrawidgets.core.utils.twemoji_image_provider import QTwemojiImageProvider
+from qextrawidgets.gui.items import QIconItem
+from qextrawidgets.gui.models import QFilteredUniqueCheckedListModel, QIconPickerModel
 from qextrawidgets.gui.validators import QEmojiValidator
+from qextrawidgets.widgets.delegates.grid_icon_delegate import QGridIconDelegate
+from qextrawidgets.widgets.delegates.multiple_roles_delegate import QMultipleRolesDelegate
+from qextrawidgets.widgets.miscellaneous.dual_list import QDualList
 
 
 # emoji test file: https://unicode.org/Public/emoji/latest/emoji-test.txt
@@ -73,3 +81,249 @@ def test_emoji_validator_accepts_empty():
     validator = QEmojiValidator()
     state, _, _ = validator.validate("", 0)
     assert state == QValidator.State.Acceptable
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def make_icon_picker_model(*icon_texts):
+    model = QIconPickerModel()
+    model.addCategory("Test", "test", QIcon())
+    model.addIcons("test", [QIconItem(icon_text, False) for icon_text in icon_texts])
+    return model
+
+
+def test_icon_picker_model_defer_icon_insertions(app):
+    model = make_icon_picker_model("a")
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    with model.deferIconInsertions():
+        assert model.addIcon("test", QIconItem("b", False))
+        assert model.addIcon("test", QIconItem("c", False))
+        assert model.addIcon("test", QIconItem("d", False))
+        # Already queued, or already in the category
+        assert not model.addIcon("test", QIconItem("b", False))
+        assert not model.addIcon("test", QIconItem("a", False))
+        assert model.removeIcon("test", "c")
+
+        assert model.hasIcon("test", "b")
+        assert not model.hasIcon("test", "c")
+        assert model.findIconInCategoryByName("test", "d") is not None
+        assert model.findCategory("test").rowCount() == 1
+        assert inserted == []
+
+    assert inserted == [(1, 2)]
+    assert [icon_item.text() for icon_item in model.icons("test")] == ["a", "b", "d"]
+    assert model.findIconInCategoryByName("test", "d").row() == 2
+
+
+def test_icon_picker_model_remove_icons(app):
+    model = make_icon_picker_model("a", "b", "c", "d", "e", "f", "g")
+    removed = []
+    model.rowsAboutToBeRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    # "b" and "c", then "e" to "g", are adjacent rows; "x" is not in the category
+    assert model.removeIcons("test", ["g", "b", "x", "e", "c", "f"]) == 5
+    assert removed == [(4, 6), (1, 2)]
+
+    category_item = model.findCategory("test")
+    assert [category_item.child(row).text() for row in range(category_item.rowCount())] == ["a", "d"]
+    assert [icon_item.text() for icon_item in model.icons("test")] == ["a", "d"]
+    assert model.hasIcon("test", "d")
+    assert not model.hasIcon("test", "e")
+    assert model.findIconInCategoryByName("test", "d").row() == 1
+    assert model.removeIcons("missing", ["a"]) == 0
+
+
+def test_icon_picker_model_icons(app):
+    model = make_icon_picker_model("a", "b", "c")
+    assert [icon_item.text() for icon_item in model.icons("test")] == ["a", "b", "c"]
+
+    model.removeIcon("test", "b")
+    model.addIcon("test", QIconItem("d", False))
+    assert [icon_item.text() for icon_item in model.icons("test")] == ["a", "c", "d"]
+    assert model.icons("missing") == []
+
+
+def test_icon_picker_model_icon_count(app):
+    model = make_icon_picker_model("a", "b", "c")
+    assert model.iconCount("test") == 3
+
+    model.removeIcon("test", "b")
+    assert model.iconCount("test") == 2
+    model.addIcons("test", [QIconItem("c", False), QIconItem("d", False)])
+    assert model.iconCount("test") == model.findCategory("test").rowCount() == 3
+    assert model.iconCount("missing") == 0
+
+
+def make_filtered_unique_checked_list_model(*values):
+    source_model = QStandardItemModel()
+    for value in values:
+        item = QStandardItem()
+        item.setData(value, Qt.ItemDataRole.DisplayRole)
+        source_model.appendRow(item)
+    model = QFilteredUniqueCheckedListModel()
+    model.setSourceModel(source_model)
+    return source_model, model
+
+
+def list_model_values(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def test_filtered_unique_checked_list_model_unique_values(app):
+    _, model = make_filtered_unique_checked_list_model("b", "a", "b", "A", "a")
+
+    assert list_model_values(model) == ["b", "a", "A"]
+    assert model.uniqueCount() == 3
+    assert model.index(1, 0).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+
+def test_filtered_unique_checked_list_model_keeps_check_states(app):
+    source_model, model = make_filtered_unique_checked_list_model("a", "b", "c")
+    model.setData(model.index(1, 0), Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+
+    source_model.item(0).setText("d")
+
+    assert list_model_values(model) == ["d", "b", "c"]
+    assert model.index(1, 0).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+    assert model.visibleCheckedValues() == {"d", "c"}
+
+
+def test_filtered_unique_checked_list_model_filter_is_case_insensitive(app):
+    _, model = make_filtered_unique_checked_list_model("Apple", "banana", "GRAPE", "cherry")
+
+    model.setFilterFixedString("AP")
+    assert list_model_values(model) == ["Apple", "GRAPE"]
+
+    model.setFilterFixedString("")
+    assert model.rowCount() == 4
+
+
+def test_filtered_unique_checked_list_model_visible_check_state(app):
+    _, model = make_filtered_unique_checked_list_model("one", "two", "three")
+
+    model.setFilterFixedString("t")
+    model.setVisibleCheckState(Qt.CheckState.Unchecked)
+    assert model.visibleCheckedValues() == set()
+    assert model.visibleCheckedCount() == 0
+
+    model.setFilterFixedString("")
+    assert model.visibleCheckedValues() == {"one"}
+    assert model.visibleCheckedCount() == 1
+
+
+def test_filtered_unique_checked_list_model_sort_order(app):
+    _, model = make_filtered_unique_checked_list_model("b", 10, "A", 2, "c", 1.5)
+
+    model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert list_model_values(model) == [1.5, 2, 10, "A", "b", "c"]
+
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert list_model_values(model) == ["c", "b", "A", 10, 2, 1.5]
+
+
+def test_grid_icon_delegate_scaled_pixmap_keeps_logical_size(app):
+    pixmap = QPixmap(80, 80)
+    pixmap.setDevicePixelRatio(2)
+
+    scaled_pixmap = QGridIconDelegate()._scaled_pixmap(pixmap, QSize(32, 32))
+
+    assert scaled_pixmap.devicePixelRatio() == 2
+    assert scaled_pixmap.deviceIndependentSize().toSize() == QSize(32, 32)
+    assert scaled_pixmap.size() == QSize(64, 64)
+
+
+def test_twemoji_image_provider_clear_disk_cache_keeps_other_files(app, tmp_path):
+    cache_directory = tmp_path / "1.0"
+    other_version_directory = tmp_path / "0.9"
+    other_version_directory.mkdir()
+    (other_version_directory / "1F600-0-32-1.0-png.png").write_bytes(b"")
+
+    QTwemojiImageProvider.setDiskCacheEnabled(True, cache_directory)
+    try:
+        assert QTwemojiImageProvider.diskCacheDirectory() == cache_directory
+        QTwemojiImageProvider.getImage("😀", 0, 32)
+        (cache_directory / "notes.png").write_bytes(b"")
+        assert (cache_directory / "1F600-0-32-1.0-png.png").exists()
+
+        QTwemojiImageProvider.clearDiskCache()
+
+        assert [path.name for path in cache_directory.iterdir()] == ["notes.png"]
+        assert (other_version_directory / "1F600-0-32-1.0-png.png").exists()
+    finally:
+        QTwemojiImageProvider.setDiskCacheEnabled(False)
+
+
+@pytest.mark.parametrize("decoration", ["null_icon", "icon", "hidpi_pixmap", "color", None])
+def test_multiple_roles_delegate_matches_styled_item_delegate(app, decoration):
+    multiple_roles_role = Qt.ItemDataRole.UserRole + 100
+    roles = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.BackgroundRole)
+
+    class MultipleRolesModel(QStandardItemModel):
+        def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+            if role == multiple_roles_role:
+                return {r: super(MultipleRolesModel, self).data(index, r) for r in roles}
+            return super().data(index, role)
+
+    pixmap = QPixmap(40, 40)
+    pixmap.fill(QColor("red"))
+    pixmap.setDevicePixelRatio(2)
+    decorations = {"null_icon": QIcon(), "icon": QIcon(QPixmap(64, 64)), "hidpi_pixmap": pixmap, "color": QColor("green")}
+
+    model = MultipleRolesModel()
+    item = QStandardItem("value")
+    if decoration is not None:
+        item.setData(decorations[decoration], Qt.ItemDataRole.DecorationRole)
+    model.appendRow(item)
+
+    def style_option(delegate):
+        option = QStyleOptionViewItem()
+        option.decorationSize = QSize(16, 16)
+        option.state = QStyle.StateFlag.State_Enabled
+        delegate.initStyleOption(option, model.index(0, 0))
+        return option.features, QSize(option.decorationSize), option.icon.isNull(), QBrush(option.backgroundBrush), option.text
+
+    assert style_option(QMultipleRolesDelegate(multiple_roles_role=multiple_roles_role)) == style_option(
+        QStyledItemDelegate()
+    )
+
+
+def test_dual_list_drop_on_available_list_keeps_it_sorted(app):
+    dual_list = QDualList()
+    dual_list.setAvailableItems(["b", "d", "a"])
+    dual_list._move_all_items(dual_list._list_available, dual_list._list_selected)
+    dual_list._transfer_rows(dual_list._list_selected, dual_list._list_available, [0])
+
+    selected_model = dual_list._selected_model
+    proxy = dual_list._list_available.model()
+    mime_data = selected_model.mimeData([selected_model.index(0, 0)])
+    assert proxy.dropMimeData(mime_data, Qt.DropAction.MoveAction, 0, 0, QModelIndex())
+    # A move drag removes the dragged row from its view once the drop is accepted
+    selected_model.removeRows(0, 1)
+
+    assert list_model_values(proxy) == ["a", "b"]
+    assert dual_list.getSelectedItems() == ["d"]
+
+    dual_list._move_all_items(dual_list._list_available, dual_list._list_selected)
+    assert dual_list.getSelectedItems() == ["a", "b", "d"]
+
+
+def test_dual_list_transfer_keeps_selection(app):
+    dual_list = QDualList()
+    dual_list.setAvailableItems(["a", "b", "c"])
+    dual_list.setSelectedItems(["d"])
+    selection_model = dual_list._list_selected.selectionModel()
+    selection_model.select(dual_list._selected_model.index(0, 0), QItemSelectionModel.SelectionFlag.Select)
+
+    emitted = []
+    dual_list.selectionChanged.connect(emitted.append)
+
+    dual_list._transfer_rows(dual_list._list_available, dual_list._list_selected, [0, 2])
+
+    assert emitted == [["a", "c", "d"]]
+    assert dual_list.getSelectedItems() == ["a", "c", "d"]
+    assert [index.data() for index in selection_model.selectedIndexes()] == ["d"]